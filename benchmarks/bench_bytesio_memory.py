@@ -0,0 +1,80 @@
+"""
+Peak memory of reading csv from a BytesIO, as the content grows.
+
+The rows are consumed one by one, as a web handler would write them to
+a database. The BytesIO is created before tracing starts, so the peak
+is what the reader allocates on top of the upload.
+
+Usage::
+
+    python benchmarks/bench_bytesio_memory.py [megabytes ...]
+"""
+
+import sys
+import time
+import tracemalloc
+from io import BytesIO, StringIO
+
+from pyexcel_io import iget_data
+
+ROW = "%d,héllo wörld,%d.5,2026-10-18\n"
+
+
+def make_upload(megabytes):
+    row_size = len((ROW % (0, 0)).encode("utf-8"))
+    number_of_rows = megabytes * 1024 * 1024 // row_size
+    return BytesIO(
+        "".join(
+            ROW % (index, index) for index in range(number_of_rows)
+        ).encode("utf-8")
+    )
+
+
+def via_iget_data(upload):
+    sheets, _ = iget_data(upload, file_type="csv", auto_detect_int=False)
+    return sheets["csv"]
+
+
+def via_decoded_copy(upload):
+    # what the reader used to do with a BytesIO
+    text = StringIO(upload.read().decode("utf-8"))
+    sheets, _ = iget_data(text, file_type="csv", auto_detect_int=False)
+    return sheets["csv"]
+
+
+def measure(read_rows, upload):
+    upload.seek(0)
+    tracemalloc.start()
+    started = time.perf_counter()
+    number_of_rows = sum(1 for _ in read_rows(upload))
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return number_of_rows, elapsed, peak
+
+
+def main(sizes=(2, 8, 32)):
+    for megabytes in sizes:
+        upload = make_upload(megabytes)
+        for label, read_rows in (
+            ("decoded copy", via_decoded_copy),
+            ("iget_data", via_iget_data),
+        ):
+            number_of_rows, elapsed, peak = measure(read_rows, upload)
+            print(
+                "%4d MB  %-14s %6.2f sec  peak %7.1f MB  %d rows"
+                % (
+                    megabytes,
+                    label,
+                    elapsed,
+                    peak / 1024.0 / 1024.0,
+                    number_of_rows,
+                )
+            )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main([int(size) for size in sys.argv[1:]])
+    else:
+        main()
@@ -0,0 +1,59 @@
+"""
+Compare the single pass cell classifier with the int, float and date
+cascade that csv reader used to run on every cell.
+
+Usage::
+
+    python benchmarks/bench_cell_classifier.py [number_of_cells]
+"""
+
+import sys
+import time
+
+from pyexcel_io import service
+
+SAMPLE_CELLS = [
+    "hello world",
+    "Status",
+    "GB",
+    "12345",
+    "-42",
+    "3.14159",
+    "1,234,567",
+    "014325",
+    "2015-08-17",
+    "2015-08-17 19:20:00",
+    "1e10",
+    "nan",
+    "N/A",
+    "name@example.com",
+]
+
+
+def measure(convert, cells):
+    started = time.perf_counter()
+    for cell in cells:
+        convert(cell)
+    return len(cells) / (time.perf_counter() - started)
+
+
+def main(number_of_cells=1000000):
+    repeats = number_of_cells // len(SAMPLE_CELLS) + 1
+    cells = (SAMPLE_CELLS * repeats)[:number_of_cells]
+    text_cells = [SAMPLE_CELLS[0]] * number_of_cells
+
+    classify = service.make_cell_classifier()
+    for label, data in (("mixed cells", cells), ("text cells", text_cells)):
+        cascade = measure(service.detect_cell_value, data)
+        single_pass = measure(classify, data)
+        print(
+            "%-12s cascade: %12.0f cells/sec  single pass: %12.0f cells/sec"
+            "  (x%.1f)" % (label, cascade, single_pass, single_pass / cascade)
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main()
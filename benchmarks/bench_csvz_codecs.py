@@ -0,0 +1,87 @@
+"""
+Compare the compression of csvz: size against write and read speed.
+
+Usage::
+
+    python benchmarks/bench_csvz_codecs.py [number_of_rows]
+"""
+
+import sys
+import time
+from io import BytesIO
+
+from pyexcel_io import get_data, save_data
+from pyexcel_io.writers.csvz_writer import COMPRESSIONS
+
+CODECS = [
+    ("stored", None),
+    ("deflated", 1),
+    ("deflated", 6),
+    ("deflated", 9),
+    ("bzip2", 9),
+    ("lzma", None),
+]
+if "zstd" in COMPRESSIONS:
+    CODECS.append(("zstd", None))
+
+
+def make_book(number_of_rows):
+    return {
+        "orders": [
+            [index, "customer %d" % (index % 997), index * 1.25, "2026-10-18"]
+            for index in range(number_of_rows)
+        ]
+    }
+
+
+def measure(book, compression, compresslevel):
+    stream = BytesIO()
+    started = time.perf_counter()
+    save_data(
+        stream,
+        book,
+        file_type="csvz",
+        compression=compression,
+        compresslevel=compresslevel,
+    )
+    write_time = time.perf_counter() - started
+    content = stream.getvalue()
+
+    started = time.perf_counter()
+    get_data(
+        content,
+        file_type="csvz",
+        auto_detect_int=False,
+        auto_detect_float=False,
+        auto_detect_datetime=False,
+    )
+    read_time = time.perf_counter() - started
+    return len(content), write_time, read_time
+
+
+def main(number_of_rows=200000):
+    book = make_book(number_of_rows)
+    raw = BytesIO()
+    save_data(raw, book, file_type="csvz", compression="stored")
+    raw_size = len(raw.getvalue())
+    for compression, compresslevel in CODECS:
+        size, write_time, read_time = measure(book, compression, compresslevel)
+        label = compression
+        if compresslevel is not None:
+            label = "%s %d" % (compression, compresslevel)
+        print(
+            "%-12s ratio %5.1f%%  write %5.1f MB/s  read %5.1f MB/s"
+            % (
+                label,
+                100.0 * size / raw_size,
+                raw_size / write_time / 1024.0 / 1024.0,
+                raw_size / read_time / 1024.0 / 1024.0,
+            )
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main()
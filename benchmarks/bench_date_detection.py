@@ -0,0 +1,45 @@
+"""
+Compare the positional date recogniser with the strptime calls that
+detect_date_value used to make.
+
+Usage::
+
+    python benchmarks/bench_date_detection.py [number_of_cells]
+"""
+
+import sys
+import time
+
+from pyexcel_io import service
+
+SAMPLE_CELLS = {
+    "dates": ["2015-08-17", "2016-02-29", "1999-12-31"],
+    "datetimes": ["2015-08-17 19:20:00", "2015-08-17 19:20:59.999999"],
+    "text": ["Manchester", "London, UK", "a long description of a row"],
+}
+
+
+def measure(detect, cells):
+    started = time.perf_counter()
+    for cell in cells:
+        detect(cell)
+    return len(cells) / (time.perf_counter() - started)
+
+
+def main(number_of_cells=300000):
+    for label, samples in SAMPLE_CELLS.items():
+        repeats = number_of_cells // len(samples) + 1
+        cells = (samples * repeats)[:number_of_cells]
+        strptime = measure(service._detect_date_value_by_strptime, cells)
+        positional = measure(service.detect_date_value, cells)
+        print(
+            "%-10s strptime: %10.0f cells/sec  positional: %10.0f cells/sec"
+            "  (x%.1f)" % (label, strptime, positional, positional / strptime)
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main()
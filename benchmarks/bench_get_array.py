@@ -0,0 +1,63 @@
+"""
+Compare get_array with numpy.array over the rows of get_data.
+
+Usage::
+
+    python benchmarks/bench_get_array.py [number_of_rows]
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy
+
+from pyexcel_io import get_data, get_array
+from pyexcel_io._compact import StringIO
+
+
+def make_csv(number_of_rows):
+    return "\n".join(
+        "%d,%d.25,%d,%d.5" % (index, index, index * 7, index)
+        for index in range(number_of_rows)
+    )
+
+
+def measure(load, content):
+    started = time.perf_counter()
+    array = load(StringIO(content))
+    elapsed = time.perf_counter() - started
+    # tracing slows numpy down, hence a separate run for memory
+    tracemalloc.start()
+    load(StringIO(content))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return array, elapsed, peak
+
+
+def via_get_data(stream):
+    return numpy.array(get_data(stream, file_type="csv")["csv"], dtype=float)
+
+
+def via_get_array(stream):
+    return get_array(stream, file_type="csv")
+
+
+def main(number_of_rows=200000):
+    content = make_csv(number_of_rows)
+    for label, load in (
+        ("get_data + numpy.array", via_get_data),
+        ("get_array", via_get_array),
+    ):
+        array, elapsed, peak = measure(load, content)
+        print(
+            "%-24s %6.2f sec  peak %7.1f MB  shape %s"
+            % (label, elapsed, peak / 1024.0 / 1024.0, array.shape)
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main()
@@ -0,0 +1,52 @@
+"""
+Self time of the modules of pyexcel_io when it is imported.
+
+The third party plugins are left out. The best of a few runs is given,
+in microseconds, and is checked against a budget if one is given.
+
+Usage::
+
+    python benchmarks/bench_import_time.py [budget_in_microseconds]
+"""
+
+import os
+import sys
+import subprocess
+
+RUNS = 5
+
+
+def own_import_time():
+    """the self time of the modules of pyexcel_io, in microseconds"""
+    environment = dict(os.environ)
+    environment["PYEXCEL_IO_PLUGINS"] = ""
+    environment["PYTHONPATH"] = os.path.dirname(
+        os.path.dirname(os.path.abspath(__file__))
+    )
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import pyexcel_io"],
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    total = 0
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, _, module_name = line.split("|")
+        if module_name.strip().startswith("pyexcel_io"):
+            total += int(self_time.split(":")[1])
+    return total
+
+
+def main():
+    import_time = min(own_import_time() for _ in range(RUNS))
+    print("pyexcel_io imports in %d us" % import_time)
+    if len(sys.argv) > 1 and import_time > int(sys.argv[1]):
+        print("over the budget of %s us" % sys.argv[1])
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
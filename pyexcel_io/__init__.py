@@ -9,14 +9,43 @@ Uniform interface for reading/writing different excel file formats
 """
 
 import logging
+import importlib
 
 import pyexcel_io.plugins as plugins
 
-from .io import get_data, iget_data, save_data  # noqa
 from ._compact import NullHandler
 
 logging.getLogger(__name__).addHandler(NullHandler())  # noqa
 
+# they are imported when they are used for the first time
+IO_FUNCTIONS = [
+    "get_data",
+    "get_array",
+    "iget_data",
+    "save_data",
+    "iget_batches",
+]
+SUBMODULES = ["io", "book", "cache", "reader", "service", "sheet", "writer"]
+
+__all__ = IO_FUNCTIONS
+
+
+def __getattr__(name):
+    if name in IO_FUNCTIONS:
+        value = getattr(importlib.import_module(".io", __name__), name)
+    elif name in SUBMODULES:
+        value = importlib.import_module("." + name, __name__)
+    else:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name)
+        )
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(IO_FUNCTIONS) | set(SUBMODULES))
+
 
 BLACK_LIST = [__name__, "pyexcel_webio", "pyexcel_text"]
 WHITE_LIST = [
@@ -102,9 +102,11 @@ class BookReader(RWInterface):
                 file_stream.seek(0)
             except UnsupportedOperation:
                 # python 3
-                file_stream = _convert_content_to_stream(
-                    file_stream.read(), self._file_type
-                )
+                if manager.get_io_type(self._file_type) != "string":
+                    file_stream = _convert_content_to_stream(
+                        file_stream.read(), self._file_type
+                    )
+                # else: text is read forward, e.g. from a pipe
 
             self._file_stream = file_stream
             self._keywords = keywords
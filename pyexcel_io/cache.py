@@ -0,0 +1,388 @@
+"""
+pyexcel_io.cache
+~~~~~~~~~~~~~~~~~~~
+
+Caches of the data that load_data has read from files
+
+:copyright: (c) 2014-2026 by C Wang
+:license: New BSD License, see LICENSE for more details
+"""
+
+import os
+import sys
+import time
+import pickle
+import hashlib
+import tempfile
+import threading
+from array import array
+from types import MappingProxyType
+from collections import OrderedDict, namedtuple
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+DEFAULT_MEMORY_SIZE = 64 * 1024 * 1024
+ENTRY_SUFFIX = ".pickle"
+MESSAGE_INVALID_MAX_SIZE = "max_size should be a positive integer: %s"
+MESSAGE_INVALID_TTL = "ttl should be a positive number of seconds: %s"
+SIZE_SAMPLE = 64
+CONTAINER_TYPES = (list, tuple, dict, array)
+
+CacheKey = namedtuple("CacheKey", ["name", "stamp"])
+CacheStatistics = namedtuple(
+    "CacheStatistics", ["hits", "misses", "evictions", "size"]
+)
+
+
+def make_key(file_name, options):
+    """
+    the cache key of reading file_name with the options of load_data
+
+    None is given when the file cannot be looked at or an option, e.g. a
+    function, cannot be told apart from another one by its value
+    """
+    normalised_options = _normalise(options)
+    if normalised_options is None:
+        return None
+
+    try:
+        file_stat = os.stat(file_name)
+    except (OSError, TypeError, ValueError):
+        return None
+
+    name = hashlib.sha256(
+        repr((os.path.abspath(file_name), normalised_options)).encode("utf-8")
+    ).hexdigest()
+    return CacheKey(name, (file_stat.st_size, file_stat.st_mtime_ns))
+
+
+class DiskCache(object):
+    """
+    keep the data of files on disk, e.g. for reference spreadsheets that
+    are read again and again
+
+    an entry is a pickle in the directory, which is dropped when its file
+    changes in size or modification time. When the entries take more
+    than max_size bytes, the least recently used ones are removed.
+    """
+
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE):
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError(MESSAGE_INVALID_MAX_SIZE % max_size)
+        self.directory = directory
+        self.max_size = max_size
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def load(self, key, loader):
+        """the cached data of key, or what loader() gives, which is kept"""
+        entry = self.__entry(key)
+        data = self.__read(entry, key.stamp)
+        if data is not None:
+            with self.__lock:
+                self.__hits += 1
+            return data
+
+        with self.__lock:
+            self.__misses += 1
+        data = loader()
+        self.__write(entry, key.stamp, data)
+        return data
+
+    def statistics(self):
+        size = sum(entry_size for _, entry_size, _ in self.__entries())
+        with self.__lock:
+            return CacheStatistics(
+                self.__hits, self.__misses, self.__evictions, size
+            )
+
+    def clear(self):
+        for _, _, path in self.__entries():
+            _remove(path)
+
+    def __entry(self, key):
+        return os.path.join(self.directory, key.name + ENTRY_SUFFIX)
+
+    def __entries(self):
+        """the last use, the size and the path of each entry"""
+        entries = []
+        with os.scandir(self.directory) as directory_entries:
+            for entry in directory_entries:
+                if not entry.name.endswith(ENTRY_SUFFIX):
+                    continue
+                try:
+                    entry_stat = entry.stat()
+                except FileNotFoundError:
+                    # removed by another process
+                    continue
+                entries.append(
+                    (entry_stat.st_mtime_ns, entry_stat.st_size, entry.path)
+                )
+        return entries
+
+    def __read(self, entry, stamp):
+        try:
+            with open(entry, "rb") as cache_file:
+                if pickle.load(cache_file) != stamp:
+                    # the file has changed since
+                    _remove(entry)
+                    return None
+                data = pickle.load(cache_file)
+            # the modification time tells which entry is used least recently
+            os.utime(entry)
+            return data
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # e.g. an entry that was cut short
+            _remove(entry)
+            return None
+
+    def __write(self, entry, stamp, data):
+        temporary_file = None
+        try:
+            file_descriptor, temporary_file = tempfile.mkstemp(
+                dir=self.directory
+            )
+            with os.fdopen(file_descriptor, "wb") as cache_file:
+                pickle.dump(stamp, cache_file, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(data, cache_file, pickle.HIGHEST_PROTOCOL)
+            # readers see either the old entry or the new one in full
+            os.replace(temporary_file, entry)
+        except Exception:
+            # e.g. a full disk or a value that cannot be pickled. The data
+            # is given all the same
+            if temporary_file is not None:
+                _remove(temporary_file)
+            return
+        self.__evict()
+
+    def __evict(self):
+        entries = sorted(self.__entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in entries:
+            if size <= self.max_size:
+                break
+            _remove(path)
+            size -= entry_size
+            with self.__lock:
+                self.__evictions += 1
+
+
+class MemoryCache(object):
+    """
+    keep the data of files in this process, e.g. in a long running web
+    worker
+
+    the sheets are given as tuples of tuples, which cannot be changed by
+    one caller under the feet of another one. The entries are bounded by
+    their estimated size in bytes and the least recently used ones are
+    removed first. An entry is dropped when its file changes, or ttl
+    seconds after it is loaded. When several threads ask for the same
+    file at the same time, it is read by one of them only.
+    """
+
+    def __init__(self, max_size=DEFAULT_MEMORY_SIZE, ttl=None):
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError(MESSAGE_INVALID_MAX_SIZE % max_size)
+        if ttl is not None and not ttl > 0:
+            raise ValueError(MESSAGE_INVALID_TTL % ttl)
+        self.max_size = max_size
+        self.ttl = ttl
+        self.__lock = threading.Lock()
+        self.__entries = OrderedDict()
+        self.__loads = {}
+        self.__size = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def load(self, key, loader):
+        """the cached data of key, or what loader() gives, which is kept"""
+        with self.__lock:
+            data = self.__get(key)
+            if data is not None:
+                self.__hits += 1
+                return OrderedDict(data)
+
+            pending_load = self.__loads.get(key)
+            is_loader = pending_load is None
+            if is_loader:
+                pending_load = PendingLoad()
+                self.__loads[key] = pending_load
+                self.__misses += 1
+            else:
+                self.__hits += 1
+
+        if not is_loader:
+            # another thread is reading the file
+            return OrderedDict(pending_load.wait())
+
+        try:
+            data = _freeze_sheets(loader())
+        except BaseException as error:
+            with self.__lock:
+                del self.__loads[key]
+            pending_load.set_error(error)
+            raise
+
+        with self.__lock:
+            self.__put(key, data)
+            del self.__loads[key]
+        pending_load.set_result(data)
+        return OrderedDict(data)
+
+    def statistics(self):
+        with self.__lock:
+            return CacheStatistics(
+                self.__hits, self.__misses, self.__evictions, self.__size
+            )
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = 0
+
+    def __get(self, key):
+        entry = self.__entries.get(key.name)
+        if entry is None:
+            return None
+
+        stamp, data, size, expiry = entry
+        expired = expiry is not None and expiry <= time.monotonic()
+        if stamp != key.stamp or expired:
+            del self.__entries[key.name]
+            self.__size -= size
+            if expired:
+                self.__evictions += 1
+            return None
+
+        self.__entries.move_to_end(key.name)
+        return data
+
+    def __put(self, key, data):
+        size = _estimate_size(data)
+        if size > self.max_size:
+            return
+
+        expiry = None
+        if self.ttl is not None:
+            expiry = time.monotonic() + self.ttl
+        previous_entry = self.__entries.pop(key.name, None)
+        if previous_entry is not None:
+            self.__size -= previous_entry[2]
+        self.__entries[key.name] = (key.stamp, data, size, expiry)
+        self.__size += size
+        while self.__size > self.max_size:
+            _, (_, _, evicted_size, _) = self.__entries.popitem(last=False)
+            self.__size -= evicted_size
+            self.__evictions += 1
+
+
+class PendingLoad(object):
+    """the data of a file that one thread is reading for the others"""
+
+    def __init__(self):
+        self.__done = threading.Event()
+        self.data = None
+        self.error = None
+
+    def set_result(self, data):
+        self.data = data
+        self.__done.set()
+
+    def set_error(self, error):
+        self.error = error
+        self.__done.set()
+
+    def wait(self):
+        self.__done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.data
+
+
+def _freeze_sheets(sheets):
+    """the sheets in an ordered dictionary, which is copied for each hit"""
+    return OrderedDict(
+        (sheet_name, _freeze(sheet)) for sheet_name, sheet in sheets.items()
+    )
+
+
+def _freeze(value):
+    """tuples for lists, read only views for dictionaries and arrays"""
+    if isinstance(value, (list, tuple)):
+        if value and isinstance(value[0], CONTAINER_TYPES):
+            return tuple(map(_freeze, value))
+        # a row of cells
+        return tuple(value)
+
+    if isinstance(value, dict):
+        return MappingProxyType(
+            OrderedDict(
+                (item_key, _freeze(item)) for item_key, item in value.items()
+            )
+        )
+
+    if isinstance(value, array):
+        return memoryview(value).toreadonly()
+
+    return value
+
+
+def _estimate_size(value):
+    """
+    the bytes that value takes, in which the items of a long tuple are
+    estimated from a sample of them
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, tuple):
+        items = value
+        if len(value) > SIZE_SAMPLE:
+            items = value[:: len(value) // SIZE_SAMPLE][:SIZE_SAMPLE]
+        items_size = sum(_estimate_size(item) for item in items)
+        if items:
+            size += items_size * len(value) // len(items)
+    elif isinstance(value, (dict, MappingProxyType)):
+        size += sum(
+            _estimate_size(item_key) + _estimate_size(item)
+            for item_key, item in value.items()
+        )
+    elif isinstance(value, memoryview):
+        size += value.nbytes
+    return size
+
+
+def _normalise(value):
+    """a value that can be compared and hashed, or None"""
+    if value is None or isinstance(value, (str, bytes, bool, int, float)):
+        return value
+
+    if isinstance(value, type):
+        return "%s.%s" % (value.__module__, value.__qualname__)
+
+    if isinstance(value, (list, tuple)):
+        items = []
+        for item in value:
+            normalised_item = _normalise(item)
+            if normalised_item is None and item is not None:
+                return None
+            items.append(normalised_item)
+        return tuple(items)
+
+    if isinstance(value, dict):
+        items = _normalise(list(value.items()))
+        if items is None:
+            return None
+        return tuple(sorted(items, key=repr))
+
+    return None
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -37,6 +37,19 @@ MESSAGE_NOT_FILE_FORMATTER = "%s is not a file"
 MESSAGE_FILE_DOES_NOT_EXIST = "%s does not exist"
 MESSAGE_EMPTY_ARRAY = "One empty row is found"
 MESSAGE_IGNORE_ROW = "One row is ignored"
+MESSAGE_INVALID_BATCH_SIZE = "batch_size should be a positive integer: %s"
+MESSAGE_INVALID_WORKERS = "workers should be a positive integer: %s"
+MESSAGE_NUMPY_NOT_INSTALLED = (
+    "numpy is needed by get_array. Please pip install numpy"
+)
+MESSAGE_CHARDET_NOT_INSTALLED = (
+    "chardet is needed to guess the encoding of csvz. Please pip install "
+    "chardet or give the encoding"
+)
+MESSAGE_INVALID_LAYOUT = "layout should be 'rows' or 'columns': %s"
+MESSAGE_COLUMNS_LAYOUT_NOT_STREAMED = (
+    "Columns layout needs the whole sheet. Please use get_data"
+)
 MESSAGE_DB_EXCEPTION = """
 Warning: Bulk insertion got below exception. Trying to do it one by one slowly."""
 
@@ -44,6 +57,9 @@ FILE_FORMAT_CSV = "csv"
 FILE_FORMAT_TSV = "tsv"
 FILE_FORMAT_CSVZ = "csvz"
 FILE_FORMAT_TSVZ = "tsvz"
+# e.g. data.csv.gz, which is read and written through gzip
+COMPRESSED_FILE_MODULES = {"gz": "gzip", "bz2": "bz2", "xz": "lzma"}
+COMPRESSIBLE_FILE_FORMATS = [FILE_FORMAT_CSV, FILE_FORMAT_TSV]
 FILE_FORMAT_ODS = "ods"
 FILE_FORMAT_XLS = "xls"
 FILE_FORMAT_XLSX = "xlsx"
@@ -57,6 +73,9 @@ DB_QUERYSET = "queryset"
 KEYWORD_TSV_DIALECT = "excel-tab"
 KEYWORD_LINE_TERMINATOR = "lineterminator"
 
+LAYOUT_ROWS = "rows"
+LAYOUT_COLUMNS = "columns"
+
 SKIP_DATA = -1
 TAKE_DATA = 0
 STOP_ITERATION = 1
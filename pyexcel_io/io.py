@@ -11,16 +11,15 @@ The io interface to file extensions
 import os
 import warnings
 from types import GeneratorType
+from functools import partial
 
 from pyexcel_io import constants
+from pyexcel_io.utils import batched, to_columns, get_file_type
 from pyexcel_io.reader import Reader
 from pyexcel_io.writer import Writer
 from pyexcel_io.plugins import OLD_READERS, OLD_WRITERS
-from pyexcel_io._compact import isstream
-from pyexcel_io.exceptions import (
-    NoSupportingPluginFound,
-    SupportingPluginAvailableButNotInstalled,
-)
+from pyexcel_io._compact import OrderedDict, isstream
+from pyexcel_io.exceptions import NoSupportingPluginFound
 
 
 def iget_data(afile, file_type=None, **keywords):
@@ -46,7 +45,13 @@ def iget_data(afile, file_type=None, **keywords):
     :param ignore_nan_text: various forms of 'NaN', 'nan' are ignored
     :param default_float_nan: choose one form of 'NaN', 'nan'
     :param pep_0515_off: turn off pep 0515. default to True.
+    :param infer_types: 'sample:N' locks the type of each csv column after
+                        N rows. default to None
+    :param column_types: a list or a dictionary of csv column types, which
+                         are used instead of type detection. default to None
     :param keep_trailing_empty_cells: keep trailing columns. default to False
+    :param columns: a list of column indices and column names to be read.
+                    default to None
     :param keywords: any other library specific parameters
     :returns: an ordered dictionary
     """
@@ -56,6 +61,29 @@ def iget_data(afile, file_type=None, **keywords):
     return data, reader
 
 
+def iget_batches(afile, batch_size=10000, file_type=None, **keywords):
+    """Get data from an excel file source in batches of rows
+
+    Each sheet is given as a generator of lists of batch_size rows, of
+    which only the last may be shorter. It suits bulk consumers better than
+    one row at a time and takes the same parameters as :meth:`iget_data`.
+
+    :param afile: a file name, a file stream or actual content
+    :param batch_size: the maximum number of rows in a batch
+    :param file_type: used only when filename is not a physical file name
+    :param keywords: any other parameters of :meth:`iget_data`
+    :returns: an ordered dictionary of batch generators and the reader
+    """
+    data, reader = _get_data(
+        afile,
+        file_type=file_type,
+        streaming=True,
+        batch_size=batch_size,
+        **keywords
+    )
+    return data, reader
+
+
 def get_data(afile, file_type=None, streaming=None, **keywords):
     """Get data from an excel file source
 
@@ -78,7 +106,22 @@ def get_data(afile, file_type=None, streaming=None, **keywords):
     :param ignore_nan_text: various forms of 'NaN', 'nan' are ignored
     :param default_float_nan: choose one form of 'NaN', 'nan'
     :param pep_0515_off: turn off pep 0515. default to True.
+    :param infer_types: 'sample:N' locks the type of each csv column after
+                        N rows. default to None
+    :param column_types: a list or a dictionary of csv column types, which
+                         are used instead of type detection. default to None
     :param keep_trailing_empty_cells: keep trailing columns. default to False
+    :param columns: a list of column indices and column names to be read.
+                    default to None
+    :param cache: a pyexcel_io.cache.DiskCache or MemoryCache, which keeps
+                  the data of a file until the file changes. default to
+                  None
+    :param layout: 'rows' gives each sheet as a list of rows. 'columns'
+                   gives an ordered dictionary of columns, in which int
+                   and float columns are stored as array.array. default
+                   to 'rows'
+    :param header: with the 'columns' layout, the first row names the
+                   columns and is not part of them. default to True
     :param keywords: any other library specific parameters
     :returns: an ordered dictionary
     """
@@ -90,6 +133,118 @@ def get_data(afile, file_type=None, streaming=None, **keywords):
     return data
 
 
+def get_array(
+    afile,
+    dtype=None,
+    file_type=None,
+    sheet_name=None,
+    sheet_index=None,
+    batch_size=10000,
+    **keywords
+):
+    """Get a numpy array from an excel file source
+
+    Rows are read in batches of raw csv text and each batch is converted
+    by numpy at once. numpy has to be installed.
+
+    :param afile: a file name, a file stream or actual content
+    :param dtype: a numpy dtype. A structured dtype converts each column
+                  to its field. default to float64, in which empty cells
+                  become nan
+    :param file_type: used only when filename is not a physical file name
+    :param sheet_name: the name of the sheet to be loaded
+    :param sheet_index: the index of the sheet to be loaded. default to
+                        the first sheet
+    :param batch_size: the number of rows converted at a time
+    :param keywords: any other parameters of :meth:`iget_data`, e.g.
+                     start_row=1 skips a header row
+    :returns: a 2-D array, or a 1-D structured array
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(constants.MESSAGE_NUMPY_NOT_INSTALLED)
+
+    dtype = numpy.dtype(numpy.float64 if dtype is None else dtype)
+    for option in (
+        "auto_detect_int",
+        "auto_detect_float",
+        "auto_detect_datetime",
+    ):
+        keywords[option] = False
+    keywords.setdefault("keep_trailing_empty_cells", True)
+    if sheet_name is None and sheet_index is None:
+        sheet_index = 0
+
+    data, reader = iget_batches(
+        afile,
+        batch_size=batch_size,
+        file_type=file_type,
+        sheet_name=sheet_name,
+        sheet_index=sheet_index,
+        **keywords
+    )
+    try:
+        chunks = []
+        width = None
+        if dtype.names:
+            # every row has a cell for each field
+            width = len(dtype.names)
+        for batches in data.values():
+            for batch in batches:
+                batch_width = max(len(row) for row in batch)
+                if width is None or batch_width > width:
+                    # the earlier rows are padded as if they were as wide
+                    chunks = [
+                        _widen_array(numpy, chunk, batch_width, dtype)
+                        for chunk in chunks
+                    ]
+                    width = batch_width
+                text = numpy.array(_pad_rows(batch, width), dtype=str)
+                chunks.append(_convert_text_array(numpy, text, dtype))
+    finally:
+        reader.close()
+
+    if chunks:
+        return numpy.concatenate(chunks)
+    if dtype.names:
+        return numpy.empty(0, dtype=dtype)
+    return numpy.empty((0, 0), dtype=dtype)
+
+
+def _pad_rows(rows, width):
+    return [
+        row if len(row) >= width else row + [""] * (width - len(row))
+        for row in rows
+    ]
+
+
+def _widen_array(numpy, array, width, dtype):
+    """pad a 2-D array with the columns of empty cells"""
+    if dtype.names is not None:
+        # the fields of a structured array do not change
+        return array
+
+    text = numpy.full((len(array), width - array.shape[1]), "", dtype=str)
+    return numpy.hstack([array, _convert_text_column(numpy, text, dtype)])
+
+
+def _convert_text_array(numpy, text, dtype):
+    if dtype.names is None:
+        return _convert_text_column(numpy, text, dtype)
+
+    array = numpy.empty(len(text), dtype=dtype)
+    for index, name in enumerate(dtype.names):
+        array[name] = _convert_text_column(numpy, text[:, index], dtype[name])
+    return array
+
+
+def _convert_text_column(numpy, text, dtype):
+    if dtype.kind in "fc":
+        text = numpy.where(text == "", "nan", text)
+    return text.astype(dtype)
+
+
 def _get_data(afile, file_type=None, **keywords):
     if isstream(afile):
         keywords.update(
@@ -155,6 +310,10 @@ def load_data(
     sheets=None,
     library=None,
     streaming=False,
+    batch_size=None,
+    layout=constants.LAYOUT_ROWS,
+    header=True,
+    cache=None,
     **keywords
 ):
     """Load data from any supported excel formats
@@ -165,6 +324,13 @@ def load_data(
                             and it is intended to open it as forced file type.
     :param sheet_name: the name of the sheet to be loaded
     :param sheet_index: the index of the sheet to be loaded
+    :param batch_size: give each sheet as lists of batch_size rows
+    :param layout: 'rows' or 'columns'
+    :param header: whether the first row names the columns of the
+                   'columns' layout
+    :param cache: a :class:`~pyexcel_io.cache.DiskCache` or
+                  :class:`~pyexcel_io.cache.MemoryCache`, which keeps the
+                  data of a file until the file changes
     :param keywords: any other parameters
     """
     result = {}
@@ -173,19 +339,51 @@ def load_data(
     if len(number_of_none_inputs) != 1:
         raise IOError(constants.MESSAGE_ERROR_02)
 
+    if batch_size is not None and batch_size < 1:
+        raise ValueError(constants.MESSAGE_INVALID_BATCH_SIZE % batch_size)
+
+    if layout not in (constants.LAYOUT_ROWS, constants.LAYOUT_COLUMNS):
+        raise ValueError(constants.MESSAGE_INVALID_LAYOUT % layout)
+
+    if layout == constants.LAYOUT_COLUMNS and streaming:
+        raise ValueError(constants.MESSAGE_COLUMNS_LAYOUT_NOT_STREAMED)
+
+    if cache is not None and file_name is not None and not streaming:
+        options = dict(
+            file_type=file_type,
+            force_file_type=force_file_type,
+            sheet_name=sheet_name,
+            sheet_index=sheet_index,
+            sheets=sheets,
+            library=library,
+            batch_size=batch_size,
+            layout=layout,
+            header=header,
+            **keywords
+        )
+        from pyexcel_io.cache import make_key
+
+        key = make_key(file_name, options)
+        if key is not None:
+            result = cache.load(
+                key, lambda: load_data(file_name=file_name, **options)[0]
+            )
+            return result, None
+
     if file_type is None:
         if force_file_type:
             file_type = force_file_type
         else:
             try:
-                file_type = file_name.split(".")[-1]
+                file_type = get_file_type(file_name)
             except AttributeError:
                 raise Exception(constants.MESSAGE_FILE_NAME_SHOULD_BE_STRING)
 
-    try:
-        reader = OLD_READERS.get_a_plugin(file_type, library)
-    except (NoSupportingPluginFound, SupportingPluginAvailableButNotInstalled):
+    if OLD_READERS.find_a_plugin(file_type, library) is None:
         reader = Reader(file_type, library)
+        reader.batch_size = batch_size
+    else:
+        reader = OLD_READERS.get_a_plugin(file_type, library)
 
     try:
         if file_name:
@@ -204,9 +402,19 @@ def load_data(
             result = reader.read_many(sheets)
         else:
             result = reader.read_all()
-        if streaming is False:
+        if batch_size and not isinstance(reader, Reader):
             for key in result.keys():
-                result[key] = list(result[key])
+                result[key] = batched(result[key], batch_size)
+        if streaming is False:
+            if layout == constants.LAYOUT_COLUMNS:
+                gather = partial(to_columns, header=header)
+            else:
+                gather = list
+            # the sheets of a forward-only book are gathered as they are
+            # found
+            result = OrderedDict(
+                (key, gather(content)) for key, content in result.items()
+            )
             reader.close()
             reader = None
 
@@ -250,16 +458,16 @@ def get_writer(
             file_type = force_file_type
         else:
             try:
-                file_type = file_name.split(".")[-1]
+                file_type = get_file_type(file_name)
             except AttributeError:
                 raise Exception(constants.MESSAGE_FILE_NAME_SHOULD_BE_STRING)
 
         file_type_given = False
 
-    try:
-        writer = OLD_WRITERS.get_a_plugin(file_type, library)
-    except (NoSupportingPluginFound, SupportingPluginAvailableButNotInstalled):
+    if OLD_WRITERS.find_a_plugin(file_type, library) is None:
         writer = Writer(file_type, library)
+    else:
+        writer = OLD_WRITERS.get_a_plugin(file_type, library)
 
     if file_name:
         if file_type_given:
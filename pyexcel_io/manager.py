@@ -14,6 +14,8 @@ MIME_TYPES = {}
 FILE_TYPES = ()
 TEXT_STREAM_TYPES = []
 BINARY_STREAM_TYPES = []
+# file type -> "string" or "bytes", for the look ups of get_io_type
+STREAM_TYPES = {}
 
 
 def register_stream_type(file_type, stream_type):
@@ -21,9 +23,14 @@ def register_stream_type(file_type, stream_type):
     keep track of stream type for different file formats
     """
     if stream_type == "text":
-        TEXT_STREAM_TYPES.append(file_type)
+        if file_type not in TEXT_STREAM_TYPES:
+            TEXT_STREAM_TYPES.append(file_type)
+        STREAM_TYPES[file_type] = "string"
     elif stream_type == "binary":
-        BINARY_STREAM_TYPES.append(file_type)
+        if file_type not in BINARY_STREAM_TYPES:
+            BINARY_STREAM_TYPES.append(file_type)
+        # a text stream is preferred, when both are registered
+        STREAM_TYPES.setdefault(file_type, "bytes")
 
 
 def get_io(file_type):
@@ -32,14 +39,11 @@ def get_io(file_type):
     :param file_type: a supported file type
     :returns: a appropriate io stream, None otherwise
     """
-    __file_type = None
-    if file_type:
-        __file_type = file_type.lower()
-
-    if __file_type in TEXT_STREAM_TYPES:
+    io_type = get_io_type(file_type)
+    if io_type == "string":
         return StringIO()
 
-    elif __file_type in BINARY_STREAM_TYPES:
+    elif io_type == "bytes":
         return BytesIO()
 
     else:
@@ -52,27 +56,19 @@ def get_io_type(file_type):
     :param file_type: a supported file type
     :returns: a appropriate io stream, None otherwise
     """
-    __file_type = None
-    if file_type:
-        __file_type = file_type.lower()
-
-    if __file_type in TEXT_STREAM_TYPES:
-        return "string"
-
-    elif __file_type in BINARY_STREAM_TYPES:
-        return "bytes"
-
-    else:
+    if not file_type:
         return None
 
+    return STREAM_TYPES.get(file_type.lower())
+
 
 def register_a_file_type(file_type, stream_type, mime_type):
     """
     keep track of file format supports by this library
     """
     global FILE_TYPES
-    FILE_TYPES += (file_type,)
-    stream_type = stream_type
+    if file_type not in FILE_TYPES:
+        FILE_TYPES += (file_type,)
     if mime_type is not None:
         MIME_TYPES[file_type] = mime_type
     register_stream_type(file_type, stream_type)
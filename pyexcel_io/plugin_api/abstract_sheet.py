@@ -5,6 +5,15 @@ class ISheet(object):
     def column_iterator(self, row):
         raise NotImplementedError("iterate each column at a given row")
 
+    def select_columns(self, columns):
+        """
+        Optionally, let column_iterator give the selected columns only
+
+        columns is a slice, or a list of column indices and column names.
+        Return True if the selection will be taken care of.
+        """
+        return False
+
 
 class ISheetWriter(object):
     def write_row(self, data_row):
@@ -8,13 +8,21 @@ factory for getting readers and writers
 :license: New BSD License, see LICENSE for more details
 """
 
+import os
+import re
+import sys
+import zlib
+import logging
+
 import pyexcel_io.utils as ioutils
 import pyexcel_io.manager as manager
 import pyexcel_io.constants as constants
 import pyexcel_io.exceptions as exceptions
-from lml.loader import scan_plugins_regex
+from lml.utils import do_import
 from lml.plugin import PluginInfo, PluginManager, PluginInfoChain
 
+log = logging.getLogger(__name__)
+
 ERROR_MESSAGE_FORMATTER = "one of these plugins for %s data in '%s': %s"
 UPGRADE_MESSAGE = "Please upgrade the plugin '%s' according to \
 plugin compactibility table."
@@ -22,6 +30,13 @@ READER_PLUGIN = "pyexcel-io reader"
 READER_PLUGIN_V2 = "pyexcel-io v2 reader"
 WRITER_PLUGIN = "pyexcel-io writer"
 WRITER_PLUGIN_V2 = "pyexcel-io v2 writer"
+# comma separated plugin modules, which are loaded without a scan
+PLUGINS_VARIABLE = "PYEXCEL_IO_PLUGINS"
+# where the manifests of the scanned plugins are kept. Without it,
+# sys.path is scanned on every import
+MANIFEST_DIRECTORY_VARIABLE = "PYEXCEL_IO_CACHE_DIR"
+# the files and directories that pip and setuptools keep for a package
+DISTRIBUTION_METADATA = (".dist-info", ".egg-info", ".egg-link", ".pth")
 
 
 class IOPluginInfo(PluginInfo):
@@ -114,6 +129,9 @@ class IOManager(PluginManager):
     """Manage pyexcel-io plugins"""
 
     def __init__(self, plugin_type, known_list):
+        # the plugin classes, or None, that are found for the keys of
+        # get_a_plugin. It is cleared when a plugin registers
+        self.resolved_plugins = {}
         PluginManager.__init__(self, plugin_type)
         self.known_plugins = known_list
         self.action = "read"
@@ -122,23 +140,39 @@ class IOManager(PluginManager):
 
     def load_me_later(self, plugin_info):
         PluginManager.load_me_later(self, plugin_info)
+        self.resolved_plugins.clear()
         _do_additional_registration(plugin_info)
 
     def register_a_plugin(self, cls, plugin_info):
         """for dynamically loaded plugin"""
         PluginManager.register_a_plugin(self, cls, plugin_info)
+        self.resolved_plugins.clear()
         _do_additional_registration(plugin_info)
 
     def get_a_plugin(self, file_type=None, library=None, **keywords):
+        plugin = self.find_a_plugin(file_type, library)
         __file_type = file_type.lower()
-        try:
-            plugin = self.load_me_now(__file_type, library=library)
-        except Exception:
+        if plugin is None:
             self.raise_exception(__file_type)
         handler = plugin()
         handler.set_type(__file_type)
         return handler
 
+    def find_a_plugin(self, file_type, library=None):
+        """the plugin class for file_type, or None when there is none"""
+        key = (file_type, library)
+        try:
+            return self.resolved_plugins[key]
+        except KeyError:
+            pass
+
+        try:
+            plugin = self.load_me_now(file_type.lower(), library=library)
+        except Exception:
+            plugin = None
+        self.resolved_plugins[key] = plugin
+        return plugin
+
     def raise_exception(self, file_type):
         plugins = self.known_plugins.get(file_type, None)
         if plugins:
@@ -172,18 +206,27 @@ class IOManager(PluginManager):
 class NewIOManager(IOManager):
     def load_me_later(self, plugin_info):
         PluginManager.load_me_later(self, plugin_info)
+        self.resolved_plugins.clear()
         _do_additional_registration_for_new_plugins(plugin_info)
 
     def register_a_plugin(self, cls, plugin_info):
         """for dynamically loaded plugin"""
         PluginManager.register_a_plugin(self, cls, plugin_info)
+        self.resolved_plugins.clear()
         _do_additional_registration_for_new_plugins(plugin_info)
 
     def get_a_plugin(
         self, file_type=None, location=None, library=None, **keywords
     ):
+        key = (location, file_type, library)
+        try:
+            return self.resolved_plugins[key]
+        except KeyError:
+            pass
+
         __file_type = file_type.lower()
         plugin = self.load_me_now(f"{location}-{__file_type}", library=library)
+        self.resolved_plugins[key] = plugin
         return plugin
 
     def raise_exception(self, file_type):
@@ -217,15 +260,11 @@ class NewIOManager(IOManager):
 
 def _do_additional_registration(plugin_info):
     for file_type in plugin_info.tags():
-        manager.register_stream_type(file_type, plugin_info.stream_type)
         manager.register_a_file_type(file_type, plugin_info.stream_type, None)
 
 
 def _do_additional_registration_for_new_plugins(plugin_info):
     for file_type in plugin_info.tags():
-        manager.register_stream_type(
-            file_type.split("-")[1], plugin_info.stream_type
-        )
         manager.register_a_file_type(
             file_type.split("-")[1], plugin_info.stream_type, None
         )
@@ -254,10 +293,187 @@ WRITERS = AllWriters()
 
 
 def load_plugins(plugin_name_patterns, path, black_list, white_list):
-    """Try to discover all pyexcel-io plugins"""
-    scan_plugins_regex(
-        plugin_name_patterns=plugin_name_patterns,
-        pyinstaller_path=path,
-        black_list=black_list,
-        white_list=white_list,
+    """
+    Try to discover all pyexcel-io plugins
+
+    the plugin modules that a scan of the installed packages finds can
+    be kept in a manifest in PYEXCEL_IO_CACHE_DIR, which is used until
+    the installed packages change. When PYEXCEL_IO_PLUGINS is set, the
+    comma separated modules in it are loaded and nothing is scanned.
+    """
+    pinned_plugins = os.environ.get(PLUGINS_VARIABLE)
+    if pinned_plugins is None:
+        module_names = _find_plugins(plugin_name_patterns)
+        if getattr(sys, "frozen", False):
+            from lml.loader import scan_from_pyinstaller
+
+            module_names.extend(
+                scan_from_pyinstaller(plugin_name_patterns, path)
+            )
+    else:
+        module_names = [
+            module_name.strip()
+            for module_name in pinned_plugins.split(",")
+            if module_name.strip()
+        ]
+
+    for module_name in module_names + list(white_list):
+        if module_name in black_list:
+            log.debug("ignored %s", module_name)
+            continue
+
+        try:
+            do_import(module_name)
+        except ImportError as e:
+            log.debug(module_name)
+            log.debug(e)
+
+
+def _find_plugins(plugin_name_patterns):
+    """
+    the plugin modules in a scan of sys.path
+
+    When PYEXCEL_IO_CACHE_DIR is set, what is found outside the current
+    directory and the directory of the script is kept in a manifest in
+    it. These two directories change all the time and are scanned on
+    every import.
+    """
+    directory = os.environ.get(MANIFEST_DIRECTORY_VARIABLE)
+    if not directory:
+        return _scan_for_plugins(plugin_name_patterns, None)
+
+    script_directories = _get_script_directories()
+    local_entries = []
+    entries = []
+    for entry in sys.path:
+        try:
+            entry_directory = _normalize(entry or os.curdir)
+        except (TypeError, ValueError):
+            entry_directory = None
+        if entry_directory in script_directories:
+            # by its absolute path, as the importer of '' stays in the
+            # directory that was current when it was made
+            local_entries.append(entry_directory)
+        else:
+            entries.append(entry)
+
+    manifest = os.path.join(
+        directory, _get_manifest_name(plugin_name_patterns)
     )
+    fingerprint = _get_fingerprint(entries)
+    module_names = _read_manifest(manifest, fingerprint)
+    if module_names is None:
+        module_names = _scan_for_plugins(plugin_name_patterns, entries)
+        _write_manifest(manifest, fingerprint, module_names)
+    local_names = _scan_for_plugins(plugin_name_patterns, local_entries)
+    return local_names + [
+        module_name
+        for module_name in module_names
+        if module_name not in local_names
+    ]
+
+
+def _scan_for_plugins(plugin_name_patterns, entries):
+    """the plugin packages in the entries, or in sys.path if None"""
+    import pkgutil
+
+    log.debug("scanning for plugins...")
+    return [
+        module_info[1]
+        for module_info in pkgutil.iter_modules(entries)
+        if module_info[2] and re.match(plugin_name_patterns, module_info[1])
+    ]
+
+
+def _get_manifest_name(plugin_name_patterns):
+    """one manifest per python installation"""
+    key = repr((sys.executable, sys.version, plugin_name_patterns))
+    return "plugins-%08x.txt" % zlib.crc32(key.encode("utf-8"))
+
+
+def _get_fingerprint(entries):
+    """
+    the python installation and the entries of sys.path
+
+    A site directory is known by the metadata of its distributions,
+    which changes when a package is installed, upgraded or removed. Any
+    other entry is known by its modification time.
+    """
+    stamps = [sys.executable, sys.version]
+    site_directories = _get_site_directories()
+    for entry in entries:
+        try:
+            directory = _normalize(entry or os.curdir)
+            if directory in site_directories:
+                stamp = _get_distributions(directory)
+            else:
+                stamp = os.stat(directory).st_mtime_ns
+        except (OSError, TypeError, ValueError):
+            stamp = None
+        stamps.append((entry, stamp))
+    return repr(stamps)
+
+
+def _get_script_directories():
+    directories = {_normalize(os.curdir)}
+    argv = getattr(sys, "argv", None)
+    if argv and argv[0]:
+        directories.add(os.path.dirname(_normalize(argv[0])))
+    return directories
+
+
+def _get_site_directories():
+    import site
+
+    directories = list(getattr(site, "getsitepackages", lambda: [])())
+    if site.ENABLE_USER_SITE:
+        directories.append(site.getusersitepackages())
+    return {_normalize(directory) for directory in directories}
+
+
+def _get_distributions(directory):
+    """the names of the distribution metadata in a site directory"""
+    return sorted(
+        name
+        for name in os.listdir(directory)
+        if name.endswith(DISTRIBUTION_METADATA)
+    )
+
+
+def _normalize(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _read_manifest(manifest, fingerprint):
+    """the module names in the manifest, or None when it is out of date"""
+    try:
+        with open(manifest, "r", encoding="utf-8") as manifest_file:
+            lines = manifest_file.read().splitlines()
+    except (OSError, ValueError):
+        return None
+
+    if not lines or lines[0] != fingerprint:
+        return None
+    return lines[1:]
+
+
+def _write_manifest(manifest, fingerprint, module_names):
+    import tempfile
+
+    temporary_file = None
+    try:
+        directory = os.path.dirname(manifest)
+        os.makedirs(directory, exist_ok=True)
+        file_descriptor, temporary_file = tempfile.mkstemp(dir=directory)
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as f:
+            f.write("\n".join([fingerprint] + module_names) + "\n")
+        # another process reads either the old manifest or the new one
+        os.replace(temporary_file, manifest)
+    except OSError:
+        # e.g. a read only directory, in which case sys.path is scanned
+        # every time
+        if temporary_file is not None:
+            try:
+                os.remove(temporary_file)
+            except OSError:
+                pass
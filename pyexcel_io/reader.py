@@ -1,6 +1,10 @@
-from pyexcel_io.sheet import SheetReader
+from collections.abc import Sized, MutableMapping
+
+from pyexcel_io.sheet import SheetReader, _trim_trailing_empty_cells
+from pyexcel_io.utils import _index_filter
 from pyexcel_io.plugins import NEW_READERS
 from pyexcel_io._compact import OrderedDict
+from pyexcel_io.plugin_api import IReader
 
 
 def clean_keywords(keywords):
@@ -16,6 +20,7 @@ def clean_keywords(keywords):
         "skip_empty_rows",
         "row_renderer",
         "keep_trailing_empty_cells",
+        "columns",
     ]
     for arg in keywords:
         if arg in args_list:
@@ -37,6 +42,9 @@ class Reader(object):
         # useless setter and getter functions like Java.
         # in pyexcel, this attribute is mainly used for testing
         self.reader_class = None
+        # when it is set, each sheet is given as lists of batch_size rows
+        self.batch_size = None
+        self._native_sheets = OrderedDict()
 
     def open(self, file_name, **keywords):
         if self.reader_class is None:
@@ -82,14 +90,25 @@ class Reader(object):
 
     def read_sheet_by_index(self, sheet_index):
         sheet_reader = self.reader.read_sheet(sheet_index)
-        sheet_names = self.reader.sheet_names()
+        sheet_name = _get_sheet_name(self.reader, sheet_index)
+        self._native_sheets[sheet_name] = sheet_reader
         sheet = EncapsulatedSheetReader(sheet_reader, **self.keywords)
-        return {sheet_names[sheet_index]: sheet.to_array()}
+        if self.batch_size:
+            content = sheet.to_batches(self.batch_size)
+        else:
+            content = sheet.to_array()
+        return {sheet_name: content}
 
     def read_all(self):
         """
         read everything from a excel data book
+
+        the sheets of a forward-only book are read as they are asked for
         """
+        content_array = getattr(self.reader, "content_array", None)
+        if content_array is not None and not isinstance(content_array, Sized):
+            return StreamedBook(self)
+
         result = OrderedDict()
         for sheet_index in range(len(self.reader)):
             content_dict = self.read_sheet_by_index(sheet_index)
@@ -108,6 +127,17 @@ class Reader(object):
                 result.update(self.read_sheet_by_name(sheet))
         return result
 
+    def cache_info(self):
+        """
+        the conversion cache statistics of each sheet that has been read,
+        e.g. a csv sheet that is read with conversion_cache
+        """
+        return OrderedDict(
+            (sheet_name, sheet.cache_info())
+            for sheet_name, sheet in self._native_sheets.items()
+            if hasattr(sheet, "cache_info")
+        )
+
     def close(self):
         return self.reader.close()
 
@@ -118,9 +148,145 @@ class Reader(object):
         self.close()
 
 
+def _get_sheet_name(reader, sheet_index):
+    """
+    look up one sheet name only, which a forward-only reader can give
+    without reading ahead
+    """
+    sheet_names = getattr(type(reader), "sheet_names", None)
+    if sheet_names is IReader.sheet_names:
+        return reader.content_array[sheet_index].name
+    return reader.sheet_names()[sheet_index]
+
+
+class StreamedBook(MutableMapping):
+    """
+    the sheets of a forward-only book, which are found one after another
+
+    a sheet is read only when it is asked for, or when a later sheet is
+    """
+
+    def __init__(self, reader):
+        self.__reader = reader
+        self.__sheets = OrderedDict()
+        self.__names = []
+        self.__sheets_read = 0
+        self.__finished = False
+
+    def __read_next_sheet(self):
+        if self.__finished:
+            return False
+
+        try:
+            sheet = self.__reader.read_sheet_by_index(self.__sheets_read)
+        except IndexError:
+            self.__finished = True
+            return False
+
+        self.__sheets_read += 1
+        for name, content in sheet.items():
+            self[name] = content
+        return True
+
+    def __getitem__(self, name):
+        while name not in self.__sheets:
+            if not self.__read_next_sheet():
+                raise KeyError(name)
+        return self.__sheets[name]
+
+    def __setitem__(self, name, content):
+        if name not in self.__sheets:
+            self.__names.append(name)
+        self.__sheets[name] = content
+
+    def __delitem__(self, name):
+        del self.__sheets[name]
+        self.__names.remove(name)
+
+    def __iter__(self):
+        index = 0
+        while index < len(self.__names) or self.__read_next_sheet():
+            yield self.__names[index]
+            index += 1
+
+    def __len__(self):
+        while self.__read_next_sheet():
+            pass
+        return len(self.__names)
+
+
 class EncapsulatedSheetReader(SheetReader):
+    def __init__(self, sheet, **keywords):
+        super().__init__(sheet, **keywords)
+        self._push_down_column_selection()
+
+    def _push_down_column_selection(self):
+        """
+        let the native sheet skip the unwanted columns before conversion
+        """
+        select_columns = getattr(self._native_sheet, "select_columns", None)
+        if select_columns is None:
+            return
+
+        if self._columns is not None:
+            if select_columns(self._columns):
+                self._columns = None
+        elif self._skip_column is _index_filter and (
+            self._start_column > 0 or self._column_limit > 0
+        ):
+            stop = None
+            if self._column_limit > 0:
+                stop = self._start_column + self._column_limit
+            if select_columns(slice(self._start_column, stop)):
+                self._start_column = 0
+                self._column_limit = -1
+
+    def to_batches(self, batch_size):
+        """
+        pass the batches of a native sheet through, unless the rows have
+        to be filtered one at a time
+        """
+        native_batches = getattr(self._native_sheet, "to_batches", None)
+        if (
+            native_batches is None
+            or self._columns is not None
+            or self._skip_row is not _index_filter
+            or self._filters_columns()
+        ):
+            return super().to_batches(batch_size)
+        stop = None
+        if self._row_limit > 0:
+            stop = self._start_row + self._row_limit
+        batches = native_batches(batch_size, self._start_row, stop)
+        return self._pass_batches(batches, batch_size)
+
+    def _pass_batches(self, batches, batch_size):
+        """
+        filter the rows of the native batches and put them back into
+        batches of batch_size rows
+        """
+        pending = []
+        for batch in batches:
+            if not self.keep_trailing_empty_cells:
+                for row in batch:
+                    _trim_trailing_empty_cells(row)
+            if self._skip_empty_rows:
+                batch = [row for row in batch if row]
+            if self._row_renderer:
+                batch = [self._row_renderer(row) for row in batch]
+            if not pending and len(batch) == batch_size:
+                yield batch
+                continue
+
+            pending.extend(batch)
+            while len(pending) >= batch_size:
+                yield pending[:batch_size]
+                pending = pending[batch_size:]
+        if pending:
+            yield pending
+
     def row_iterator(self):
-        yield from self._native_sheet.row_iterator()
+        return self._native_sheet.row_iterator()
 
     def column_iterator(self, row):
-        yield from self._native_sheet.column_iterator(row)
+        return self._native_sheet.column_iterator(row)
@@ -1,7 +1,7 @@
 import mmap
 
 from pyexcel_io.book import _convert_content_to_stream
-from pyexcel_io.readers.csv_sheet import CSVMemoryMapIterator
+from pyexcel_io.readers.csv_sheet import open_buffer
 from pyexcel_io.readers.csv_in_memory import MemoryReader
 
 
@@ -15,13 +15,11 @@ class ContentReader(MemoryReader):
     @staticmethod
     def convert_content_to_stream(file_content, file_type, **keywords):
         encoding = keywords.get("encoding", "utf-8")
-        if isinstance(file_content, mmap.mmap):
-            # load from mmap
-            file_stream = CSVMemoryMapIterator(file_content, encoding)
+        if isinstance(file_content, (bytes, bytearray, memoryview, mmap.mmap)):
+            # decoded block by block as the rows are read. newline=""
+            # keeps the line endings in quoted fields, as StringIO does
+            file_stream = open_buffer(file_content, encoding, newline="")
         else:
-            if isinstance(file_content, bytes):
-                file_content = file_content.decode(encoding)
-
             file_stream = _convert_content_to_stream(file_content, file_type)
 
         return file_stream
@@ -4,6 +4,7 @@ import glob
 
 from pyexcel_io import constants
 from pyexcel_io.sheet import NamedContent
+from pyexcel_io.utils import split_file_name
 from pyexcel_io.plugin_api import IReader
 from pyexcel_io.readers.csv_sheet import CSVFileReader
 
@@ -23,7 +24,7 @@ class FileReader(IReader):
         self.__line_terminator = keywords.get(
             constants.KEYWORD_LINE_TERMINATOR, DEFAULT_NEWLINE
         )
-        names = os.path.splitext(file_name)
+        names = split_file_name(file_name)
         filepattern = "%s%s*%s*%s" % (
             names[0],
             constants.DEFAULT_MULTI_CSV_SEPARATOR,
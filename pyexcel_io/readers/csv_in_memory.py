@@ -1,12 +1,12 @@
 import re
 
-import pyexcel_io._compact as compact
 from pyexcel_io import constants
 from pyexcel_io.sheet import NamedContent
 from pyexcel_io.plugin_api import IReader
 from pyexcel_io.readers.csv_sheet import CSVinMemoryReader
 
-DEFAULT_SHEET_SEPARATOR_FORMATTER = f"---{constants.DEFAULT_NAME}---%s"
+SHEET_SEPARATOR = constants.SEPARATOR_FORMATTER % ""
+LINE_ENDINGS = "\r\n"
 
 
 class MemoryReader(IReader):
@@ -24,31 +24,12 @@ class MemoryReader(IReader):
         self.file_type = file_type
 
         self.__load_from_memory_flag = True
-        self.__line_terminator = keywords.get(
-            constants.KEYWORD_LINE_TERMINATOR, constants.DEFAULT_CSV_NEWLINE
-        )
-        separator = DEFAULT_SHEET_SEPARATOR_FORMATTER % self.__line_terminator
         if multiple_sheets:
-            # will be slow for large files
             file_stream.seek(0)
-            content = file_stream.read()
-            sheets = content.split(separator)
-            named_contents = []
-            for sheet in sheets:
-                if sheet == "":  # skip empty named sheet
-                    continue
-
-                lines = sheet.split(self.__line_terminator)
-                result = re.match(constants.SEPARATOR_MATCHER, lines[0])
-                new_content = "\n".join(lines[1:])
-                new_sheet = NamedContent(
-                    result.group(1), compact.StringIO(new_content)
-                )
-                named_contents.append(new_sheet)
-            self.content_array = named_contents
+            self.content_array = _find_sheets(file_stream)
 
         else:
-            if hasattr(file_stream, "seek"):
+            if _is_seekable(file_stream):
                 file_stream.seek(0)
             self.content_array = [NamedContent(self.file_type, file_stream)]
 
@@ -60,3 +41,86 @@ class MemoryReader(IReader):
     def close(self):
         for reader in self.handles:
             reader.close()
+
+
+def _is_seekable(file_stream):
+    """a pipe has seek() but cannot seek"""
+    seekable = getattr(file_stream, "seekable", None)
+    if seekable is not None:
+        return seekable()
+    return hasattr(file_stream, "seek")
+
+
+def _find_sheets(file_stream):
+    """
+    find the sheets in one pass, without copying them
+
+    each sheet starts after a ---pyexcel:name--- line and ends at the
+    next ---pyexcel--- line
+    """
+    named_contents = []
+    cursor = StreamCursor(file_stream)
+    in_sheet = False
+    for line in iter(file_stream.readline, ""):
+        line = line.rstrip(LINE_ENDINGS)
+        if in_sheet:
+            in_sheet = line != SHEET_SEPARATOR
+            continue
+
+        result = re.match(constants.SEPARATOR_MATCHER, line)
+        if result:
+            sheet = SheetView(cursor, file_stream.tell())
+            named_contents.append(NamedContent(result.group(1), sheet))
+            in_sheet = True
+    return named_contents
+
+
+class StreamCursor(object):
+    """
+    which sheet view has moved the shared stream last
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.owner = None
+
+    def take(self, view):
+        if self.owner is not None:
+            self.owner.suspend()
+        self.owner = view
+
+
+class SheetView(object):
+    """
+    the lines of one sheet, read from the shared stream on demand
+    """
+
+    def __init__(self, cursor, start):
+        self.__cursor = cursor
+        self.__position = start
+        self.__finished = False
+
+    def __iter__(self):
+        cursor = self.__cursor
+        readline = cursor.stream.readline
+        while not self.__finished:
+            if cursor.owner is not self:
+                cursor.take(self)
+                cursor.stream.seek(self.__position)
+            line = readline()
+            if line == "" or (
+                line.startswith(SHEET_SEPARATOR)
+                and line.rstrip(LINE_ENDINGS) == SHEET_SEPARATOR
+            ):
+                self.close()
+                return
+            yield line
+
+    def suspend(self):
+        """remember the position, before another view moves the stream"""
+        self.__position = self.__cursor.stream.tell()
+
+    def close(self):
+        self.__finished = True
+        if self.__cursor.owner is self:
+            self.__cursor.owner = None
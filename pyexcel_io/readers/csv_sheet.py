@@ -8,12 +8,22 @@ csv file reader
 :license: New BSD License, see LICENSE for more details
 """
 
+import io
+import os
 import csv
+import mmap
+import codecs
+import pickle
+import functools
+import itertools
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 
 import pyexcel_io.service as service
 import pyexcel_io._compact as compact
 import pyexcel_io.constants as constants
-from pyexcel_io.plugin_api import ISheet
+from pyexcel_io.utils import open_file, get_workers, get_compression
+from pyexcel_io.plugin_api import ISheet, NamedContent
 
 DEFAULT_SEPARATOR = "__"
 DEFAULT_SHEET_SEPARATOR_FORMATTER = "---%s---" % constants.DEFAULT_NAME + "%s"
@@ -26,6 +36,121 @@ BOM_LITTLE_ENDIAN = b"\xff\xfe"
 BOM_BIG_ENDIAN = b"\xfe\ff"
 LITTLE_ENDIAN = 0
 BIG_ENDIAN = 1
+INFER_TYPES_BY_SAMPLING = "sample"
+MESSAGE_INVALID_INFER_TYPES = (
+    "infer_types should look like 'sample:1000' but %s is given"
+)
+MESSAGE_INVALID_COLUMN_TYPES = (
+    "column_types should be a list or a dictionary of types or converters"
+)
+MESSAGE_COLUMN_NOT_FOUND = "Column '%s' is not found in the header row"
+MESSAGE_INVALID_CONVERSION_CACHE = (
+    "conversion_cache should be a positive integer but %s is given"
+)
+# quote characters and newlines are single bytes that never appear inside
+# a multi-byte character of these encodings
+SPLITTABLE_ENCODINGS = ["utf-8", "utf-8-sig", "ascii", "iso8859-1", "cp1252"]
+SPLITTABLE_DIALECTS = [None, "excel", constants.KEYWORD_TSV_DIALECT]
+SPLITTABLE_FORMAT_PARAMETERS = [
+    "dialect",
+    "delimiter",
+    "quotechar",
+    "escapechar",
+    "doublequote",
+    "quoting",
+    "lineterminator",
+    "skipinitialspace",
+    "strict",
+]
+CHUNK_SIZE = 4 * 1024 * 1024
+DECODE_BLOCK_SIZE = 1024 * 1024
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class MemoryViewIO(io.RawIOBase):
+    """
+    Read only binary stream over a buffer, e.g. mmap, bytes or memoryview
+
+    The bytes are copied out of the buffer only when they are read.
+    """
+
+    def __init__(self, buffer, close_buffer=False):
+        super().__init__()
+        self.__buffer = buffer
+        self.__view = memoryview(buffer).cast("B")
+        self.__position = 0
+        self.__close_buffer = close_buffer
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, array):
+        start = self.__position
+        end = min(start + len(array), len(self.__view))
+        array[: end - start] = self.__view[start:end]
+        self.__position = end
+        return end - start
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.__position
+        elif whence == io.SEEK_END:
+            offset += len(self.__view)
+        self.__position = max(offset, 0)
+        return self.__position
+
+    def tell(self):
+        return self.__position
+
+    def close(self):
+        if not self.closed:
+            # an mmap cannot be closed while it is viewed
+            self.__view.release()
+            if self.__close_buffer:
+                self.__buffer.close()
+        super().close()
+
+
+class BorrowedStreamIO(io.RawIOBase):
+    """
+    Read only view of a binary stream that belongs to the caller
+
+    Closing it, or collecting its readers, leaves the stream open.
+    """
+
+    def __init__(self, stream):
+        super().__init__()
+        # read1 returns what a pipe has got, instead of waiting for more
+        self.__read = getattr(stream, "read1", stream.read)
+
+    def readable(self):
+        return True
+
+    def readinto(self, array):
+        data = self.__read(len(array))
+        array[: len(data)] = data
+        return len(data)
+
+
+def open_buffer(buffer, encoding, close_buffer=False, newline=None):
+    """
+    a unicode reader that decodes the buffer block by block
+
+    newlines are translated as in open(file_name, "r"), unless newline
+    says otherwise
+    """
+    return io.TextIOWrapper(
+        io.BufferedReader(
+            MemoryViewIO(buffer, close_buffer=close_buffer),
+            buffer_size=DECODE_BLOCK_SIZE,
+        ),
+        encoding=encoding,
+        newline=newline,
+    )
 
 
 class CSVMemoryMapIterator(object):
@@ -34,6 +159,9 @@ class CSVMemoryMapIterator(object):
 
     mmap object does not handle encoding at all. This class
     provide the necessary transcoding for utf-8, utf-16 and utf-32
+
+    csv readers use :func:`open_buffer` instead, which keeps quoted
+    newlines.
     """
 
     def __init__(self, mmap_obj, encoding):
@@ -107,55 +235,285 @@ class CSVSheetReader(ISheet):
         pep_0515_off=True,
         ignore_nan_text=False,
         default_float_nan=None,
+        infer_types=None,
+        column_types=None,
+        conversion_cache=None,
+        workers=None,
+        use_mmap=False,
         **keywords
     ):
         self._native_sheet = sheet
         self._encoding = encoding
-        self.__auto_detect_int = auto_detect_int
-        self.__auto_detect_float = auto_detect_float
-        self.__ignore_infinity = ignore_infinity
-        self.__auto_detect_datetime = auto_detect_datetime
         self.__file_handle = None
-        self.__pep_0515_off = pep_0515_off
-        self.__ignore_nan_text = ignore_nan_text
-        self.__default_float_nan = default_float_nan
+        self.__convert_cell = service.make_cell_classifier(
+            auto_detect_int=auto_detect_int,
+            auto_detect_float=auto_detect_float,
+            auto_detect_datetime=auto_detect_datetime,
+            ignore_infinity=ignore_infinity,
+            pep_0515_off=pep_0515_off,
+            ignore_nan_text=ignore_nan_text,
+            default_float_nan=default_float_nan,
+        )
+        self.__detects_types = (
+            auto_detect_int or auto_detect_float or auto_detect_datetime
+        )
+        self.__sample_size = _get_sample_size(infer_types)
+        self.__rows_sampled = 0
+        self.__sampled_types = []
+        self.__column_types = _get_column_types(column_types)
+        self.__fixed_converters = {}
+        self.__header_row = None
+        self.__column_converters = None
+        self.__column_selection = None
+        self.__cache_size = _get_cache_size(conversion_cache)
+        self.__cached_converters = []
+        self._workers = get_workers(workers)
+        # only a file on disk is memory-mapped
+        self._use_mmap = use_mmap
+        if self.__column_types and not self.__needs_header():
+            self.__fix_column_converters(None)
         self._keywords = keywords
 
+    def select_columns(self, columns):
+        """
+        only the raw fields of the selected columns will be converted
+        """
+        self.__column_selection = columns
+        return True
+
+    def cache_info(self):
+        """
+        hits and misses of the conversion cache, summed over all columns
+        """
+        hits = misses = currsize = 0
+        for converter in self.__cached_converters:
+            info = converter.cache_info()
+            hits += info.hits
+            misses += info.misses
+            currsize += info.currsize
+        return CacheInfo(hits, misses, self.__cache_size or 0, currsize)
+
     def get_file_handle(self):
         """return me unicode reader for csv"""
         raise NotImplementedError("Please implement get_file_handle()")
 
     def row_iterator(self):
         self.__file_handle = self.get_file_handle()
-        return csv.reader(self.__file_handle, **self._keywords)
+        rows = csv.reader(self.__file_handle, **self._keywords)
+        if self.__needs_header():
+            header = next(rows, None)
+            if header is None:
+                return iter([])
+
+            self.__fix_column_converters(header)
+            if isinstance(self.__column_selection, list):
+                self.__column_selection = _find_column_indices(
+                    self.__column_selection, header
+                )
+            self.__header_row = header
+            return itertools.chain([header], rows)
+
+        return rows
+
+    def to_batches(self, batch_size, start=0, stop=None):
+        """
+        the rows in lists of at most batch_size rows, which are taken from
+        csv.reader and converted a block at a time
+
+        only the rows from start up to stop are converted
+        """
+        rows = itertools.islice(self.row_iterator(), start, stop)
+        while True:
+            block = list(itertools.islice(rows, batch_size))
+            if not block:
+                return
+            yield self._convert_rows(block)
+
+    def _convert_rows(self, rows):
+        plain_columns = (
+            self.__column_selection is None
+            and self.__column_converters is None
+            and not self.__sample_size
+            and not self.__cache_size
+        )
+        if not plain_columns:
+            return [list(self.column_iterator(row)) for row in rows]
+
+        if not self.__detects_types:
+            return rows
+        convert_cell = self.__convert_cell
+        return [
+            [cell if cell == "" else convert_cell(cell) for cell in row]
+            for row in rows
+        ]
 
     def column_iterator(self, row):
+        indices = None
+        if self.__column_selection is not None:
+            indices = self.__get_selected_indices(row)
+
+        if row is self.__header_row:
+            # column names are not converted
+            if indices is None:
+                return iter(row)
+            return iter([_get_cell(row, index) for index in indices])
+
+        if self.__sample_size:
+            if self.__rows_sampled < self.__sample_size:
+                self.__rows_sampled += 1
+                return self.__sample_columns(row, indices)
+
+            self.__lock_column_converters()
+
+        if self.__cache_size:
+            return self.__convert_columns_with_cache(row, indices)
+
+        if self.__column_converters is None and indices is None:
+            if not self.__detects_types:
+                return iter(row)
+            return self.__convert_columns(row)
+
+        return self.__convert_columns_individually(row, indices)
+
+    def __get_selected_indices(self, row):
+        selection = self.__column_selection
+        if isinstance(selection, slice):
+            return compact.irange(*selection.indices(len(row)))
+        return selection
+
+    def __convert_columns(self, row):
+        convert_cell = self.__convert_cell
         for element in row:
             if element is not None and element != "":
-                element = self.__convert_cell(element)
+                element = convert_cell(element)
+            yield element
+
+    def __convert_columns_individually(self, row, indices):
+        converters = self.__column_converters or ()
+        number_of_converters = len(converters)
+        convert_cell = self.__convert_cell
+        if indices is None:
+            indices = compact.irange(len(row))
+        for index in indices:
+            element = _get_cell(row, index)
+            if element is not None and element != "":
+                if index < number_of_converters:
+                    element = converters[index](element)
+                else:
+                    element = convert_cell(element)
             yield element
 
-    def __convert_cell(self, csv_cell_text):
-        ret = None
-        if self.__auto_detect_int:
-            ret = service.detect_int_value(csv_cell_text, self.__pep_0515_off)
-        if ret is None and self.__auto_detect_float:
-            ret = service.detect_float_value(
-                csv_cell_text,
-                self.__pep_0515_off,
-                ignore_nan_text=self.__ignore_nan_text,
-                default_float_nan=self.__default_float_nan,
+    def __convert_columns_with_cache(self, row, indices):
+        cached_converters = self.__cached_converters
+        if indices is None:
+            indices = compact.irange(len(row))
+        for index in indices:
+            element = _get_cell(row, index)
+            if element is not None and element != "":
+                if index >= len(cached_converters):
+                    self.__cache_column_converters(index + 1)
+                element = cached_converters[index](element)
+            yield element
+
+    def __cache_column_converters(self, number_of_columns):
+        """
+        give each column its own bounded cache of converted values
+        """
+        converters = self.__column_converters or ()
+        cached_converters = self.__cached_converters
+        for index in range(len(cached_converters), number_of_columns):
+            if index < len(converters):
+                converter = converters[index]
+            else:
+                converter = self.__convert_cell
+            cached_converters.append(
+                functools.lru_cache(maxsize=self.__cache_size)(converter)
             )
-            shall_we_ignore_the_conversion = (
-                ret in [float("inf"), float("-inf")]
-            ) and self.__ignore_infinity
-            if shall_we_ignore_the_conversion:
-                ret = None
-        if ret is None and self.__auto_detect_datetime:
-            ret = service.detect_date_value(csv_cell_text)
-        if ret is None:
-            ret = csv_cell_text
-        return ret
+
+    def __sample_columns(self, row, indices):
+        convert_cell = self.__convert_cell
+        fixed_converters = self.__fixed_converters
+        sampled_types = self.__sampled_types
+        if indices is None:
+            indices = compact.irange(len(row))
+        for index in indices:
+            element = _get_cell(row, index)
+            if element is not None and element != "":
+                if index in fixed_converters:
+                    element = fixed_converters[index](element)
+                else:
+                    element = convert_cell(element)
+                    if len(sampled_types) <= index:
+                        sampled_types.extend(
+                            set()
+                            for _ in range(index + 1 - len(sampled_types))
+                        )
+                    sampled_types[index].add(type(element))
+            yield element
+
+    def __lock_column_converters(self):
+        """
+        decide the converter of each column upon what has been sampled
+
+        text columns are no longer type detected. int and float columns
+        are converted with int() and float() first.
+        """
+        self.__sample_size = None
+        convert_cell = self.__convert_cell
+        converters = []
+        for types in self.__sampled_types:
+            if types == {str}:
+                converters.append(compact.text_type)
+            elif types == {int}:
+                converters.append(service.make_int_converter(convert_cell))
+            elif types == {float}:
+                converters.append(service.make_float_converter(convert_cell))
+            else:
+                converters.append(convert_cell)
+        self.__column_converters = self.__merge_converters(converters)
+        self.__cached_converters = []
+        self.__sampled_types = []
+
+    def __needs_header(self):
+        names_in_column_types = self.__column_types is not None and any(
+            isinstance(key, compact.text_type) for key in self.__column_types
+        )
+        names_in_selection = isinstance(self.__column_selection, list) and any(
+            isinstance(column, compact.text_type)
+            for column in self.__column_selection
+        )
+        return names_in_column_types or names_in_selection
+
+    def __fix_column_converters(self, header):
+        """
+        compile the column types into converters by column index
+        """
+        if self.__column_types is None:
+            return
+
+        fixed_converters = {}
+        for key, converter in self.__column_types.items():
+            if isinstance(key, compact.text_type):
+                if key not in header:
+                    raise ValueError(MESSAGE_COLUMN_NOT_FOUND % key)
+                key = header.index(key)
+            if converter is not None:
+                fixed_converters[key] = converter
+        self.__fixed_converters = fixed_converters
+        self.__column_converters = self.__merge_converters([])
+        self.__cached_converters = []
+
+    def __merge_converters(self, converters):
+        fixed_converters = self.__fixed_converters
+        if fixed_converters:
+            number_of_columns = max(fixed_converters) + 1
+            if len(converters) < number_of_columns:
+                converters = converters + [self.__convert_cell] * (
+                    number_of_columns - len(converters)
+                )
+            for index, converter in fixed_converters.items():
+                converters[index] = converter
+        return tuple(converters)
 
     def close(self):
         if self.__file_handle:
@@ -166,28 +524,305 @@ class CSVSheetReader(ISheet):
 # yes, no run, no file open.
 
 
+def _get_cell(row, index):
+    if index < len(row):
+        return row[index]
+    return ""
+
+
+def _find_column_indices(columns, header):
+    indices = []
+    for column in columns:
+        if isinstance(column, compact.text_type):
+            if column not in header:
+                raise ValueError(MESSAGE_COLUMN_NOT_FOUND % column)
+            column = header.index(column)
+        indices.append(column)
+    return indices
+
+
+def _get_sample_size(infer_types):
+    if infer_types is None:
+        return None
+
+    try:
+        mode, size = infer_types.split(":")
+        size = int(size)
+    except (AttributeError, ValueError):
+        mode = size = None
+    if mode != INFER_TYPES_BY_SAMPLING or size is None or size < 1:
+        raise ValueError(MESSAGE_INVALID_INFER_TYPES % infer_types)
+    return size
+
+
+def _get_cache_size(conversion_cache):
+    if conversion_cache is None:
+        return None
+
+    if not isinstance(conversion_cache, int) or conversion_cache < 1:
+        raise ValueError(MESSAGE_INVALID_CONVERSION_CACHE % conversion_cache)
+    return conversion_cache
+
+
+def _get_column_types(column_types):
+    """
+    turn a list or a dictionary of column types into a dictionary of
+    converters keyed by column index or column name
+    """
+    if column_types is None:
+        return None
+
+    if isinstance(column_types, dict):
+        items = column_types.items()
+    elif isinstance(column_types, (list, tuple)):
+        items = enumerate(column_types)
+    else:
+        raise ValueError(MESSAGE_INVALID_COLUMN_TYPES)
+
+    converters = {}
+    for key, column_type in items:
+        if not isinstance(key, (int, compact.text_type)):
+            raise ValueError(MESSAGE_INVALID_COLUMN_TYPES)
+        if column_type is None:
+            converters[key] = None
+        else:
+            converters[key] = service.get_csv_converter(column_type)
+    return converters
+
+
 class CSVFileReader(CSVSheetReader):
     """read csv from physical file"""
 
+    def __init__(self, sheet, **keywords):
+        super().__init__(sheet, **keywords)
+        self.__sheet_keywords = keywords
+        self.__selected_columns = None
+        self.__executor = None
+        self.__parallel_rows = None
+
+    def select_columns(self, columns):
+        self.__selected_columns = columns
+        return super().select_columns(columns)
+
     def get_file_handle(self):
-        unicode_reader = open(
+        if self._use_mmap and not get_compression(self._native_sheet.payload):
+            with open(self._native_sheet.payload, "rb") as csv_file:
+                if os.fstat(csv_file.fileno()).st_size > 0:
+                    memory_map = mmap.mmap(
+                        csv_file.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+                    if hasattr(memory_map, "madvise"):
+                        memory_map.madvise(mmap.MADV_SEQUENTIAL)
+                    return open_buffer(
+                        memory_map, self._encoding, close_buffer=True
+                    )
+
+        unicode_reader = open_file(
             self._native_sheet.payload, "r", encoding=self._encoding
         )
         return unicode_reader
 
+    def row_iterator(self):
+        if self._workers and self._workers > 1 and self.__can_split():
+            boundaries = _find_record_boundaries(
+                self._native_sheet.payload,
+                CHUNK_SIZE,
+                self._keywords,
+                codecs.lookup(self._encoding).name,
+            )
+            if boundaries is not None and len(boundaries) > 3:
+                self.__parallel_rows = self.__convert_in_parallel(boundaries)
+                return self.__parallel_rows
+
+        return super().row_iterator()
+
+    def column_iterator(self, row):
+        if self.__executor is not None:
+            # the workers have converted the row
+            return iter(row)
+        return super().column_iterator(row)
+
+    def _convert_rows(self, rows):
+        if self.__executor is not None:
+            return rows
+        return super()._convert_rows(rows)
+
+    def __can_split(self):
+        if get_compression(self._native_sheet.payload):
+            # a compressed file cannot be read from the middle
+            return False
+
+        keywords = dict(self.__sheet_keywords)
+        keywords.pop("workers", None)
+        encoding = codecs.lookup(keywords.get("encoding", "utf-8")).name
+        if encoding not in SPLITTABLE_ENCODINGS:
+            return False
+
+        if keywords.get("infer_types") is not None:
+            # sampling has to see the rows in order
+            return False
+
+        if keywords.get("dialect") not in SPLITTABLE_DIALECTS:
+            return False
+
+        for keyword in self._keywords:
+            if keyword not in SPLITTABLE_FORMAT_PARAMETERS:
+                return False
+
+        try:
+            pickle.dumps((keywords, self.__selected_columns))
+        except Exception:
+            # e.g. a lambda in column_types
+            return False
+
+        self.__sheet_keywords = keywords
+        return True
+
+    def __convert_in_parallel(self, boundaries):
+        """
+        hand out byte ranges to worker processes, a few at a time, and
+        give back their rows in the original order
+        """
+        file_name = self._native_sheet.payload
+        header_end = boundaries.pop(1)
+        with open(file_name, "rb") as csv_file:
+            header = csv_file.read(header_end)
+        byte_ranges = zip(boundaries, boundaries[1:])
+        self.__executor = ProcessPoolExecutor(max_workers=self._workers)
+        pending = deque()
+
+        def submit(byte_range):
+            start, end = byte_range
+            pending.append(
+                self.__executor.submit(
+                    _convert_byte_range,
+                    file_name,
+                    start,
+                    end,
+                    header if start > 0 else b"",
+                    self.__sheet_keywords,
+                    self.__selected_columns,
+                )
+            )
+
+        try:
+            for byte_range in itertools.islice(byte_ranges, 2 * self._workers):
+                submit(byte_range)
+            while pending:
+                rows = pending.popleft().result()
+                for byte_range in itertools.islice(byte_ranges, 1):
+                    submit(byte_range)
+                for row in rows:
+                    yield row
+        finally:
+            for future in pending:
+                future.cancel()
+            self.__executor.shutdown()
+
+    def close(self):
+        super().close()
+        if self.__parallel_rows is not None:
+            # cancels the pending byte ranges
+            self.__parallel_rows.close()
+
+
+def _find_record_boundaries(file_name, chunk_size, keywords, encoding):
+    """
+    byte offsets of the first record, the second record, the records
+    after every chunk_size bytes and the end of the file
+
+    the records are found by the csv module, with the format parameters
+    of the sheet, so that quotes are told apart as in a serial read. The
+    file is decoded as latin-1, in which a character is a byte. None is
+    given when the csv module cannot read the file in this way, e.g. a
+    quote character that is not ascii.
+    """
+    dialect = csv.reader([], **keywords).dialect
+    special_characters = (
+        dialect.delimiter,
+        dialect.quotechar,
+        dialect.escapechar,
+    )
+    for character in special_characters:
+        if character is not None and ord(character) > 127:
+            return None
+
+    boundaries = [0]
+    offset = 0
+    with open(file_name, "r", encoding="latin-1", newline="") as csv_file:
+        if encoding == "utf-8-sig":
+            # utf-8-sig leaves out the byte order mark
+            byte_order_mark = codecs.BOM_UTF8.decode("latin-1")
+            if csv_file.read(len(byte_order_mark)) == byte_order_mark:
+                offset = len(byte_order_mark)
+            else:
+                csv_file.seek(0)
+
+        def lines():
+            nonlocal offset
+            for line in csv_file:
+                offset += len(line)
+                yield line
+
+        records = csv.reader(lines(), **keywords)
+        try:
+            # the records are read one line at a time, hence offset is
+            # where the last record ends
+            if next(records, None) is not None:
+                boundaries.append(offset)
+            target = offset + chunk_size
+            for _ in records:
+                if offset >= target:
+                    boundaries.append(offset)
+                    target = offset + chunk_size
+        except csv.Error:
+            # e.g. a carriage return in the middle of a line
+            return None
+
+    if boundaries[-1] < offset:
+        boundaries.append(offset)
+    return boundaries
+
+
+def _convert_byte_range(file_name, start, end, header, keywords, columns):
+    """
+    read the records between start and end as CSVFileReader would
+
+    the header record is put in front of the records so that column names
+    could be found. It is then left out.
+    """
+    with open(file_name, "rb") as csv_file:
+        csv_file.seek(start)
+        content = header + csv_file.read(end - start)
+    text = content.decode(keywords.get("encoding", "utf-8"))
+    # universal newlines, as in open(file_name, "r")
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    sheet = CSVinMemoryReader(
+        NamedContent(file_name, compact.StringIO(text)), **keywords
+    )
+    if columns is not None:
+        sheet.select_columns(columns)
+    rows = [list(sheet.column_iterator(row)) for row in sheet.row_iterator()]
+    if header:
+        rows = rows[1:]
+    return rows
+
 
 class CSVinMemoryReader(CSVSheetReader):
     """read csv file from memory"""
 
     def get_file_handle(self):
-        if isinstance(self._native_sheet.payload, compact.BytesIO):
-            # please note that
-            # if the end developer feed us bytesio in python3
-            # we will do the conversion to StriongIO but that
-            # comes at a cost.
-            content = self._native_sheet.payload.read()
-            unicode_reader = compact.StringIO(content.decode(self._encoding))
-        else:
-            unicode_reader = self._native_sheet.payload
+        payload = self._native_sheet.payload
+        if isinstance(payload, (io.BufferedIOBase, io.RawIOBase)):
+            # e.g. BytesIO or sys.stdin.buffer, which are decoded
+            # block by block as rows are read. newline="" keeps the
+            # line endings as they were, like StringIO does
+            return io.TextIOWrapper(
+                io.BufferedReader(
+                    BorrowedStreamIO(payload), buffer_size=DECODE_BLOCK_SIZE
+                ),
+                encoding=self._encoding,
+                newline="",
+            )
 
-        return unicode_reader
+        return payload
@@ -8,24 +8,32 @@ The lower level csvz file format handler.
 :license: New BSD License, see LICENSE for more details
 """
 
+import io
 import zipfile
+import functools
 from io import BytesIO
 
-try:
-    import chardet
-except ImportError:
-    print("Please install chardet so as to use csvz")
-    raise
 from pyexcel_io import constants
 from pyexcel_io.sheet import NamedContent
-from pyexcel_io._compact import StringIO
 from pyexcel_io.readers.csv_sheet import CSVinMemoryReader
+from pyexcel_io.readers.zip_stream import ZipStream
 from pyexcel_io.plugin_api.abstract_reader import IReader
 
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
 
 class FileReader(IReader):
     def __init__(self, file_alike_object, file_type, **keywords):
         self.content_array = []
+        self.zipfile = None
+        self.keywords = keywords
+        if file_type == constants.FILE_FORMAT_TSVZ:
+            self.keywords["dialect"] = constants.KEYWORD_TSV_DIALECT
+        if _is_forward_only(file_alike_object):
+            # e.g. a pipe, which zipfile cannot seek in
+            self.content_array = StreamedSheets(ZipStream(file_alike_object))
+            return
+
         try:
             self.zipfile = zipfile.ZipFile(file_alike_object, "r")
             sheets = [
@@ -33,9 +41,6 @@ class FileReader(IReader):
                 for name in self.zipfile.namelist()
             ]
             self.content_array = sheets
-            self.keywords = keywords
-            if file_type == constants.FILE_FORMAT_TSVZ:
-                self.keywords["dialect"] = constants.KEYWORD_TSV_DIALECT
 
         except zipfile.BadZipfile:
             print("StringIO instance was passed by any chance?")
@@ -46,12 +51,54 @@ class FileReader(IReader):
             self.zipfile.close()
 
     def read_sheet(self, index):
-        name = self.content_array[index].name
-        content = self.zipfile.read(self.content_array[index].payload)
-        encoding_guess = chardet.detect(content)
-        sheet = StringIO(content.decode(encoding_guess["encoding"]))
+        named_content = self.content_array[index]
+        if self.zipfile is None:
+            open_member = self.content_array.open
+        else:
+            open_member = self.zipfile.open
+        member = NamedContent(
+            named_content.name,
+            functools.partial(open_member, named_content.payload),
+        )
+        return CSVZipSheetReader(member, **self.keywords)
+
+
+class CSVZipSheetReader(CSVinMemoryReader):
+    """
+    read a csv member, which is decompressed only when its rows are read
+
+    the encoding is detected on the first ENCODING_SAMPLE_SIZE bytes,
+    unless it is given
+    """
+
+    def __init__(self, sheet, encoding=None, **keywords):
+        super().__init__(sheet, **keywords)
+        self.__encoding = encoding
+
+    def get_file_handle(self):
+        binary_stream = self._native_sheet.payload()
+        encoding = self.__encoding
+        if encoding is None:
+            encoding = _guess_encoding(_sample(binary_stream))
+        if isinstance(binary_stream, io.RawIOBase):
+            binary_stream = io.BufferedReader(binary_stream)
+        return io.TextIOWrapper(binary_stream, encoding=encoding, newline="")
+
+
+class StreamedSheets(object):
+    """
+    the sheets of a zip stream, which are found as they are asked for
+    """
+
+    def __init__(self, zip_stream):
+        self.__zip_stream = zip_stream
 
-        return CSVinMemoryReader(NamedContent(name, sheet), **self.keywords)
+    def __getitem__(self, index):
+        member = self.__zip_stream[index]
+        return NamedContent(_get_sheet_name(member.name), member)
+
+    def open(self, member):
+        return self.__zip_stream.open(member)
 
 
 class ContentReader(FileReader):
@@ -60,6 +107,38 @@ class ContentReader(FileReader):
         super().__init__(io, file_type, **keywords)
 
 
+def _is_forward_only(file_alike_object):
+    if not hasattr(file_alike_object, "read"):
+        return False
+
+    seekable = getattr(file_alike_object, "seekable", None)
+    return seekable is not None and not seekable()
+
+
+def _sample(binary_stream):
+    sample = getattr(binary_stream, "sample", None)
+    if sample is not None:
+        return sample(ENCODING_SAMPLE_SIZE)
+
+    content = binary_stream.read(ENCODING_SAMPLE_SIZE)
+    # a zip member is decompressed again from its start
+    binary_stream.seek(0)
+    return content
+
+
+def _guess_encoding(sample):
+    try:
+        import chardet
+    except ImportError:
+        raise ImportError(constants.MESSAGE_CHARDET_NOT_INSTALLED)
+
+    encoding = chardet.detect(sample)["encoding"]
+    if encoding is None or encoding == "ascii":
+        # the rest of the content could go beyond ascii
+        encoding = "utf-8"
+    return encoding
+
+
 def _get_sheet_name(filename):
     len_of_a_dot = 1
     len_of_csv_word = 3
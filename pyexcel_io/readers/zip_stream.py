@@ -0,0 +1,306 @@
+"""
+pyexcel_io.readers.zip_stream
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Read zip members from a forward-only stream, e.g. a pipe
+
+zipfile.ZipFile needs to seek to the central directory at the end of the
+file. Here, the local file headers are read one after another instead.
+The member under the read head is decompressed while it is read. The
+members that are passed over, in order to reach a later one, are kept in
+memory in their compressed form.
+
+:copyright: (c) 2014-2026 by C Wang
+:license: New BSD License, see LICENSE for more details
+"""
+
+import io
+import zlib
+import struct
+import zipfile
+
+LOCAL_FILE_HEADER_SIGNATURE = b"PK\x03\x04"
+DATA_DESCRIPTOR_SIGNATURE = b"PK\x07\x08"
+FLAG_DATA_DESCRIPTOR = 0x08
+FLAG_UTF8_FILE_NAME = 0x800
+ZIP64_EXTRA_FIELD = 0x0001
+ZIP64_LIMIT = 0xFFFFFFFF
+READ_BLOCK_SIZE = 64 * 1024
+MESSAGE_CANNOT_STREAM = "Cannot find the end of %s in a forward-only stream"
+MESSAGE_BAD_CRC = "Bad CRC-32 for %s"
+
+
+class ZipStream(object):
+    """
+    the members of a zip archive in a forward-only binary stream
+    """
+
+    def __init__(self, stream):
+        self.__stream = _PushbackStream(stream)
+        self.__members = []
+        self.__head = None
+        self.__finished = False
+
+    def __getitem__(self, index):
+        while index >= len(self.__members) and self.__read_next_member():
+            pass
+        return self.__members[index]
+
+    def open(self, member):
+        """
+        a binary stream of the decompressed content of the member
+        """
+        if member is self.__head:
+            self.__head = None
+            member.reader = MemberReader(member, self.__stream)
+            return member.reader
+
+        return MemberReader(member, _PushbackStream(io.BytesIO(member.data)))
+
+    def __read_next_member(self):
+        if self.__finished:
+            return False
+
+        if self.__head is not None:
+            # pass over the member under the read head
+            self.__head.data = _read_compressed_data(
+                self.__head, self.__stream
+            )
+            self.__head = None
+        for member in self.__members:
+            if member.reader is not None:
+                member.reader.drain()
+                member.reader = None
+
+        header = self.__stream.read(zipfile.sizeFileHeader)
+        if header[:4] != LOCAL_FILE_HEADER_SIGNATURE:
+            # the central directory, or the end of the stream
+            self.__finished = True
+            return False
+
+        member = _parse_local_file_header(header, self.__stream)
+        self.__members.append(member)
+        self.__head = member
+        return True
+
+
+class ZipMember(object):
+    """
+    what a local file header says about a member
+    """
+
+    def __init__(self, name, flag_bits, compress_type, crc, sizes, zip64):
+        self.name = name
+        self.flag_bits = flag_bits
+        self.compress_type = compress_type
+        self.crc = crc
+        self.compress_size, self.file_size = sizes
+        self.zip64 = zip64
+        self.data = None
+        self.reader = None
+
+    @property
+    def has_data_descriptor(self):
+        return bool(self.flag_bits & FLAG_DATA_DESCRIPTOR)
+
+
+class MemberReader(io.RawIOBase):
+    """
+    decompress a member as it is read from the stream
+    """
+
+    def __init__(self, member, stream):
+        super().__init__()
+        self.__member = member
+        self.__stream = stream
+        self.__decompressor = zipfile._get_decompressor(member.compress_type)
+        self.__remaining = None
+        if not member.has_data_descriptor:
+            self.__remaining = member.compress_size
+        elif self.__decompressor is None:
+            raise zipfile.BadZipFile(MESSAGE_CANNOT_STREAM % member.name)
+        self.__buffer = b""
+        self.__offset = 0
+        self.__crc = 0
+        self.__eof = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, array):
+        while self.__offset == len(self.__buffer) and not self.__eof:
+            self.__fill_buffer()
+        start = self.__offset
+        size = min(len(array), len(self.__buffer) - start)
+        array[:size] = self.__buffer[start : start + size]  # noqa: E203
+        self.__offset += size
+        return size
+
+    def sample(self, size):
+        """
+        the first bytes of the content, which are read again later
+        """
+        while len(self.__buffer) - self.__offset < size and not self.__eof:
+            self.__fill_buffer()
+        return self.__buffer[self.__offset : self.__offset + size]  # noqa
+
+    def drain(self):
+        """read to the end of the member, so the next one can be found"""
+        while not self.__eof:
+            self.__fill_buffer()
+        self.__buffer = b""
+        self.__offset = 0
+
+    def __fill_buffer(self):
+        if self.__remaining is None:
+            data = self.__stream.read1(READ_BLOCK_SIZE)
+        else:
+            data = self.__stream.read1(min(self.__remaining, READ_BLOCK_SIZE))
+            self.__remaining -= len(data)
+        if self.__decompressor is None:
+            content = data
+        else:
+            content = self.__decompressor.decompress(data)
+        self.__crc = zlib.crc32(content, self.__crc)
+        self.__buffer = self.__buffer[self.__offset :] + content  # noqa
+        self.__offset = 0
+
+        ended = self.__remaining == 0 or not data
+        if self.__decompressor is not None and self.__decompressor.eof:
+            self.__stream.unread(_get_unused_data(self.__decompressor))
+            ended = True
+        if ended:
+            self.__eof = True
+            self.__finish()
+
+    def __finish(self):
+        member = self.__member
+        if member.has_data_descriptor:
+            _read_data_descriptor(member, self.__stream)
+        if self.__crc != member.crc:
+            raise zipfile.BadZipFile(MESSAGE_BAD_CRC % member.name)
+
+
+def _get_unused_data(decompressor):
+    # zipfile wraps the lzma decompressor without passing unused_data on
+    native_decompressor = getattr(decompressor, "_decomp", decompressor)
+    return getattr(native_decompressor, "unused_data", b"")
+
+
+class _PushbackStream(object):
+    def __init__(self, stream):
+        self.__stream = stream
+        # read1 returns what a pipe has got, instead of waiting for more
+        self.__read1 = getattr(stream, "read1", stream.read)
+        self.__pushed_back = b""
+
+    def read(self, size):
+        data = self.__pushed_back[:size]
+        self.__pushed_back = self.__pushed_back[size:]
+        while len(data) < size:
+            more = self.__stream.read(size - len(data))
+            if not more:
+                break
+            data += more
+        return data
+
+    def read1(self, size):
+        """at most size bytes, which are there without waiting for more"""
+        if self.__pushed_back:
+            data = self.__pushed_back[:size]
+            self.__pushed_back = self.__pushed_back[size:]
+            return data
+        return self.__read1(size)
+
+    def unread(self, data):
+        self.__pushed_back = data + self.__pushed_back
+
+
+def _parse_local_file_header(header, stream):
+    fields = struct.unpack(zipfile.structFileHeader, header)
+    flag_bits = fields[zipfile._FH_GENERAL_PURPOSE_FLAG_BITS]
+    name = stream.read(fields[zipfile._FH_FILENAME_LENGTH])
+    extra = stream.read(fields[zipfile._FH_EXTRA_FIELD_LENGTH])
+    if flag_bits & FLAG_UTF8_FILE_NAME:
+        name = name.decode("utf-8")
+    else:
+        name = name.decode("cp437")
+    sizes = [
+        fields[zipfile._FH_COMPRESSED_SIZE],
+        fields[zipfile._FH_UNCOMPRESSED_SIZE],
+    ]
+    zip64 = False
+    while len(extra) >= 4:
+        field_id, field_size = struct.unpack("<HH", extra[:4])
+        if field_id == ZIP64_EXTRA_FIELD:
+            zip64 = True
+            number_of_values = field_size // 8
+            values = iter(
+                struct.unpack(
+                    "<%dQ" % number_of_values,
+                    extra[4 : 4 + 8 * number_of_values],  # noqa: E203
+                )
+            )
+            # in the order of uncompressed size and compressed size
+            if sizes[1] == ZIP64_LIMIT:
+                sizes[1] = next(values)
+            if sizes[0] == ZIP64_LIMIT:
+                sizes[0] = next(values)
+        extra = extra[4 + field_size :]  # noqa: E203
+    return ZipMember(
+        name,
+        flag_bits,
+        fields[zipfile._FH_COMPRESSION_METHOD],
+        fields[zipfile._FH_CRC],
+        sizes,
+        zip64,
+    )
+
+
+def _read_data_descriptor(member, stream):
+    crc = stream.read(4)
+    if crc == DATA_DESCRIPTOR_SIGNATURE:
+        crc = stream.read(4)
+    member.crc = struct.unpack("<L", crc)[0]
+    if member.zip64:
+        member.compress_size, member.file_size = struct.unpack(
+            "<QQ", stream.read(16)
+        )
+    else:
+        member.compress_size, member.file_size = struct.unpack(
+            "<LL", stream.read(8)
+        )
+
+
+def _read_compressed_data(member, stream):
+    if not member.has_data_descriptor:
+        return stream.read(member.compress_size)
+
+    # only the decompressor knows where the member ends
+    chunks = []
+    reader = MemberReader(member, _RecordingStream(stream, chunks))
+    reader.drain()
+    return b"".join(chunks)
+
+
+class _RecordingStream(object):
+    """keep a copy of the compressed bytes that the member reader takes"""
+
+    def __init__(self, stream, chunks):
+        self.__stream = stream
+        self.__chunks = chunks
+
+    def read(self, size):
+        data = self.__stream.read(size)
+        self.__chunks.append(data)
+        return data
+
+    def read1(self, size):
+        data = self.__stream.read1(size)
+        self.__chunks.append(data)
+        return data
+
+    def unread(self, data):
+        if data:
+            self.__chunks[-1] = self.__chunks[-1][: -len(data)]
+        self.__stream.unread(data)
@@ -20,10 +20,54 @@ def has_no_digits_in_float(value):
     return value == math.floor(value)
 
 
+# the shapes csv.writer gives to date and datetime
+CANONICAL_DATE_TIME = re.compile(
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}"
+    r"(?: [0-9]{2}:[0-9]{2}:[0-9]{2}(\.[0-9]{1,6})?)?\Z"
+)
+
+
 def detect_date_value(cell_text):
     """
     Read the date formats that were written by csv.writer
     """
+    length = len(cell_text)
+    if length != 10 and length < 19:
+        return None
+
+    if cell_text[4:5] != "-":
+        # %Y of strptime takes exactly four digits
+        return None
+
+    text = cell_text[0:26]
+    shape = CANONICAL_DATE_TIME.match(text)
+    if shape is None or (length > 19) != (shape.group(1) is not None):
+        # e.g. 2015-1-1 and other shapes strptime also accepts
+        return _detect_date_value_by_strptime(cell_text)
+
+    try:
+        if length == 10:
+            return datetime.date(
+                int(text[0:4]), int(text[5:7]), int(text[8:10])
+            )
+
+        microsecond = 0
+        if length > 19:
+            microsecond = int(text[20:].ljust(6, "0"))
+        return datetime.datetime(
+            int(text[0:4]),
+            int(text[5:7]),
+            int(text[8:10]),
+            int(text[11:13]),
+            int(text[14:16]),
+            int(text[17:19]),
+            microsecond,
+        )
+    except ValueError:
+        return None
+
+
+def _detect_date_value_by_strptime(cell_text):
     ret = None
     try:
         if len(cell_text) == 10:
@@ -96,6 +140,239 @@ def detect_int_value(cell_text, pep_0515_off=True):
             return None
 
 
+def detect_cell_value(
+    cell_text,
+    auto_detect_int=True,
+    auto_detect_float=True,
+    auto_detect_datetime=True,
+    ignore_infinity=True,
+    pep_0515_off=True,
+    ignore_nan_text=False,
+    default_float_nan=None,
+):
+    """
+    Try int, float and then date on a csv cell text, one after another
+
+    This is the reference behaviour of csv type detection. Please use
+    :meth:`make_cell_classifier` on hot paths.
+    """
+    ret = None
+    if auto_detect_int:
+        ret = detect_int_value(cell_text, pep_0515_off)
+    if ret is None and auto_detect_float:
+        ret = detect_float_value(
+            cell_text,
+            pep_0515_off,
+            ignore_nan_text=ignore_nan_text,
+            default_float_nan=default_float_nan,
+        )
+        shall_we_ignore_the_conversion = (
+            ret in [float("inf"), float("-inf")]
+        ) and ignore_infinity
+        if shall_we_ignore_the_conversion:
+            ret = None
+    if ret is None and auto_detect_datetime:
+        ret = detect_date_value(cell_text)
+    if ret is None:
+        ret = cell_text
+    return ret
+
+
+# the shapes of the commonest csv cells, all in ascii
+CELL_SHAPES = re.compile(
+    r"(?:(?P<int>[-+]?[0-9]+)"
+    r"|(?P<float>[-+]?(?:[0-9]+\.[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?"
+    r"|[-+]?[0-9]+[eE][-+]?[0-9]+)"
+    r"|(?P<thousands>[0-9]+(?:,[0-9]+)+)"
+    r"|(?P<date>[0-9]{4}-.*)"
+    r")\Z",
+    re.DOTALL,
+)
+# int(), float() and strptime() could still say yes to texts beginning
+# with these characters, or with any white space or non-ascii character.
+NUMERIC_LEADING_CHARACTERS = frozenset("0123456789+-.")
+INFINITY_OR_NAN_LEADING_CHARACTERS = frozenset("iInN")
+INFINITY_OR_NAN_TEXTS = frozenset(["inf", "infinity", "nan"])
+INFINITIES = (float("inf"), float("-inf"))
+
+
+def make_cell_classifier(
+    auto_detect_int=True,
+    auto_detect_float=True,
+    auto_detect_datetime=True,
+    ignore_infinity=True,
+    pep_0515_off=True,
+    ignore_nan_text=False,
+    default_float_nan=None,
+):
+    """
+    Build a function that converts a csv cell text in a single pass
+
+    The returned function gives exactly what :meth:`detect_cell_value`
+    gives. It matches the cell text against the common shapes once and
+    dispatches straight to int, float, date or str. Only the unusual
+    texts, e.g. those with white spaces, underscores or non-ascii digits,
+    go through the int, float and date cascade.
+    """
+    match_shape = CELL_SHAPES.match
+
+    def detect_slowly(cell_text):
+        return detect_cell_value(
+            cell_text,
+            auto_detect_int=auto_detect_int,
+            auto_detect_float=auto_detect_float,
+            auto_detect_datetime=auto_detect_datetime,
+            ignore_infinity=ignore_infinity,
+            pep_0515_off=pep_0515_off,
+            ignore_nan_text=ignore_nan_text,
+            default_float_nan=default_float_nan,
+        )
+
+    def classify(cell_text):
+        shape = match_shape(cell_text)
+        if shape is None:
+            first = cell_text[0]
+            if (
+                first in NUMERIC_LEADING_CHARACTERS
+                or first > "\x7f"
+                or first.isspace()
+            ):
+                return detect_slowly(cell_text)
+            if first in INFINITY_OR_NAN_LEADING_CHARACTERS:
+                if (
+                    cell_text[-1].isspace()
+                    or cell_text.lower() in INFINITY_OR_NAN_TEXTS
+                ):
+                    return detect_slowly(cell_text)
+            return cell_text
+
+        kind = shape.lastgroup
+        if kind == "int":
+            if cell_text[0] == "0" and len(cell_text) > 1:
+                # do not convert if a number starts with 0
+                # e.g. 014325
+                return cell_text
+            if auto_detect_int:
+                try:
+                    return int(cell_text)
+                except ValueError:
+                    # e.g. too many digits
+                    return detect_slowly(cell_text)
+            if auto_detect_float and cell_text[0] != "0":
+                return _float_or_text(cell_text, ignore_infinity)
+            return cell_text
+
+        elif kind == "float":
+            can_be_float = auto_detect_float and (
+                cell_text[0] != "0" or cell_text.startswith("0.")
+            )
+            if can_be_float:
+                return _float_or_text(cell_text, ignore_infinity)
+            return cell_text
+
+        elif kind == "thousands":
+            if auto_detect_int and cell_text[0] != "0":
+                return int(cell_text.replace(",", ""))
+            return cell_text
+
+        # kind == "date": it cannot be an int nor a float
+        if auto_detect_datetime:
+            ret = detect_date_value(cell_text)
+            if ret is not None:
+                return ret
+        return cell_text
+
+    return classify
+
+
+PLAIN_INT = re.compile(r"-?[1-9][0-9]*\Z")
+PLAIN_FLOAT = re.compile(r"-?(?:[1-9][0-9]*|0)\.[0-9]+\Z")
+
+
+def make_int_converter(classify):
+    """
+    Convert the plain integer texts with int() directly and leave the rest
+    to the given cell classifier
+    """
+    match_int = PLAIN_INT.match
+
+    def convert(cell_text):
+        if match_int(cell_text):
+            try:
+                return int(cell_text)
+            except ValueError:
+                pass
+        return classify(cell_text)
+
+    return convert
+
+
+def make_float_converter(classify):
+    """
+    Convert the plain decimal texts with float() directly and leave the rest
+    to the given cell classifier
+    """
+    match_float = PLAIN_FLOAT.match
+
+    def convert(cell_text):
+        if match_float(cell_text):
+            ret = float(cell_text)
+            if ret not in INFINITIES:
+                return ret
+        return classify(cell_text)
+
+    return convert
+
+
+def csv_date_value(cell_text):
+    """convert a csv cell text in %Y-%m-%d to a date"""
+    ret = detect_date_value(cell_text)
+    if type(ret) is not datetime.date:
+        raise ValueError("%s is not a date" % cell_text)
+    return ret
+
+
+def csv_datetime_value(cell_text):
+    """convert a csv cell text in %Y-%m-%d[ %H:%M:%S[.%f]] to a datetime"""
+    ret = detect_date_value(cell_text)
+    if ret is None:
+        raise ValueError("%s is not a datetime" % cell_text)
+    if not isinstance(ret, datetime.datetime):
+        ret = datetime.datetime(ret.year, ret.month, ret.day)
+    return ret
+
+
+CSV_VALUE_CONVERTERS = {
+    int: int,
+    float: float,
+    str: str,
+    datetime.date: csv_date_value,
+    datetime.datetime: csv_datetime_value,
+}
+
+
+def get_csv_converter(cell_type):
+    """
+    Find the converter of a csv column type
+
+    a type could be int, float, str, datetime.date, datetime.datetime or
+    any function that takes the cell text and returns a value
+    """
+    converter = CSV_VALUE_CONVERTERS.get(cell_type)
+    if converter is None:
+        if not callable(cell_type):
+            raise ValueError("%s is not a type nor a converter" % cell_type)
+        converter = cell_type
+    return converter
+
+
+def _float_or_text(cell_text, ignore_infinity):
+    ret = float(cell_text)
+    if ignore_infinity and ret in INFINITIES:
+        return cell_text
+    return ret
+
+
 def float_value(value):
     """convert a value to float"""
     ret = float(value)
@@ -9,10 +9,12 @@ The io interface to file extensions
 """
 
 import pyexcel_io.constants as constants
-from pyexcel_io.utils import _index_filter
+from pyexcel_io.utils import batched, _index_filter
 from pyexcel_io._compact import irange
 from pyexcel_io.plugin_api import NamedContent  # noqa: F401
 
+MESSAGE_COLUMN_NOT_FOUND = "Column '%s' is not found in the first row"
+
 
 class SheetReader(object):
     """
@@ -31,6 +33,7 @@ class SheetReader(object):
         skip_empty_rows=False,
         row_renderer=None,
         keep_trailing_empty_cells=False,
+        columns=None,
         **deprecated_use_of_keywords_here
     ):
         self._native_sheet = sheet
@@ -45,6 +48,8 @@ class SheetReader(object):
         self._skip_empty_rows = skip_empty_rows
         self._row_renderer = row_renderer
         self.keep_trailing_empty_cells = keep_trailing_empty_cells
+        self._columns = columns
+        self._column_indices = None
 
         if skip_row_func:
             self._skip_row = skip_row_func
@@ -54,6 +59,9 @@ class SheetReader(object):
     def to_array(self):
         """2 dimensional representation of the content"""
         for row_index, row in enumerate(self.row_iterator()):
+            if self._columns is not None and self._column_indices is None:
+                self._column_indices = self._find_column_indices(row)
+
             row_position = self._skip_row(
                 row_index, self._start_row, self._row_limit
             )
@@ -63,28 +71,17 @@ class SheetReader(object):
             elif row_position == constants.STOP_ITERATION:
                 break
 
-            return_row = []
-            tmp_row = []
-
-            for column_index, cell_value in enumerate(
-                self.column_iterator(row)
-            ):
-                column_position = self._skip_column(
-                    column_index, self._start_column, self._column_limit
-                )
-                if column_position == constants.SKIP_DATA:
-                    continue
-
-                elif column_position == constants.STOP_ITERATION:
-                    break
-
-                if self.keep_trailing_empty_cells:
-                    return_row.append(cell_value)
-                else:
-                    tmp_row.append(cell_value)
-                    if cell_value is not None and cell_value != "":
-                        return_row += tmp_row
-                        tmp_row = []
+            cells = self.column_iterator(row)
+            if self._column_indices is not None:
+                cells = _pick_columns(list(cells), self._column_indices)
+
+            if self._filters_columns():
+                return_row = self._filter_columns(cells)
+            else:
+                return_row = list(cells)
+                if not self.keep_trailing_empty_cells:
+                    _trim_trailing_empty_cells(return_row)
+
             if self._skip_empty_rows and len(return_row) < 1:
                 # we by-pass next yeild here
                 # because it is an empty row
@@ -94,6 +91,58 @@ class SheetReader(object):
                 return_row = self._row_renderer(return_row)
             yield return_row
 
+    def _filters_columns(self):
+        return not (
+            self._skip_column is _index_filter
+            and self._start_column == 0
+            and self._column_limit < 1
+        )
+
+    def _filter_columns(self, cells):
+        return_row = []
+        tmp_row = []
+        for column_index, cell_value in enumerate(cells):
+            column_position = self._skip_column(
+                column_index, self._start_column, self._column_limit
+            )
+            if column_position == constants.SKIP_DATA:
+                continue
+
+            elif column_position == constants.STOP_ITERATION:
+                break
+
+            if self.keep_trailing_empty_cells:
+                return_row.append(cell_value)
+            else:
+                tmp_row.append(cell_value)
+                if cell_value is not None and cell_value != "":
+                    return_row += tmp_row
+                    tmp_row = []
+        return return_row
+
+    def to_batches(self, batch_size):
+        """the rows of to_array() in lists of at most batch_size rows"""
+        return batched(self.to_array(), batch_size)
+
+    def _find_column_indices(self, first_row):
+        """
+        turn the selected columns into column indices
+
+        column names are looked up in the first row
+        """
+        header = None
+        indices = []
+        for column in self._columns:
+            if isinstance(column, int):
+                indices.append(column)
+            else:
+                if header is None:
+                    header = list(self.column_iterator(first_row))
+                if column not in header:
+                    raise ValueError(MESSAGE_COLUMN_NOT_FOUND % column)
+                indices.append(header.index(column))
+        return indices
+
     def row_iterator(self):
         """
         iterate each row
@@ -135,6 +184,18 @@ class SheetReader(object):
         pass
 
 
+def _pick_columns(cells, indices):
+    number_of_cells = len(cells)
+    return [
+        cells[index] if index < number_of_cells else "" for index in indices
+    ]
+
+
+def _trim_trailing_empty_cells(row):
+    while row and (row[-1] is None or row[-1] == ""):
+        row.pop()
+
+
 class SheetWriter(object):
     """
     Generic sheet writer
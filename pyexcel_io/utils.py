@@ -8,6 +8,12 @@ utility functions
 :license: New BSD License, see LICENSE for more details
 """
 
+import os
+import importlib
+from array import array
+from itertools import islice
+from collections import OrderedDict
+
 import pyexcel_io.constants as constants
 
 XLS_PLUGIN = "pyexcel-xls"
@@ -22,6 +28,11 @@ XLSBR_PLUGIN = "pyexcel-xlsbr"
 HTMLR_PLUGIN = "pyexcel-htmlr"
 PDFR_PLUGIN = "pyexcel-pdfr"
 IO_ITSELF = "pyexcel-io"
+MIN_INT64 = -(2**63)
+MAX_INT64 = 2**63 - 1
+# the largest int that a float keeps exactly
+MAX_FLOAT_INT = 2**53
+NAN = float("nan")
 
 AVAILABLE_NEW_READERS = {}
 
@@ -81,3 +92,172 @@ def swap_empty_string_for_none(array):
             return value
 
     return [swap(x) for x in array]
+
+
+def batched(iterable, batch_size):
+    """yield lists of at most batch_size items"""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def get_workers(workers):
+    """check that workers is None or a positive integer"""
+    if workers is None:
+        return None
+
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError(constants.MESSAGE_INVALID_WORKERS % workers)
+    return workers
+
+
+def get_file_type(file_name):
+    """
+    the file type in the file name, e.g. csv for data.csv and data.csv.gz
+    """
+    extensions = file_name.split(".")
+    if get_compression(file_name):
+        return extensions[-2]
+    return extensions[-1]
+
+
+def get_compression(file_name):
+    """
+    gz, bz2 or xz for a compressed csv or tsv file name, otherwise None
+    """
+    root, compression = os.path.splitext(file_name)
+    compression = compression[1:].lower()
+    if compression not in constants.COMPRESSED_FILE_MODULES:
+        return None
+
+    file_type = os.path.splitext(root)[1][1:].lower()
+    if file_type not in constants.COMPRESSIBLE_FILE_FORMATS:
+        return None
+    return compression
+
+
+def split_file_name(file_name):
+    """
+    os.path.splitext, which keeps .csv.gz as one extension
+    """
+    root, extension = os.path.splitext(file_name)
+    if get_compression(file_name):
+        root, file_type_extension = os.path.splitext(root)
+        extension = file_type_extension + extension
+    return root, extension
+
+
+def open_file(file_name, mode, encoding, newline=None):
+    """
+    open a text file, which is decompressed or compressed on the fly if
+    its name says so, e.g. data.csv.gz
+    """
+    compression = get_compression(file_name)
+    if compression is None:
+        return open(file_name, mode, encoding=encoding, newline=newline)
+
+    module = importlib.import_module(
+        constants.COMPRESSED_FILE_MODULES[compression]
+    )
+    return module.open(
+        file_name, mode + "t", encoding=encoding, newline=newline
+    )
+
+
+def to_columns(rows, header=False):
+    """
+    turn rows into an ordered dictionary of columns, which are keyed by
+    the names in the first row if header is True and by column index
+    otherwise
+
+    A column of int values is kept in array('q') and a column of float
+    values in array('d'). An int column becomes a float column at its
+    first float or empty cell, and empty cells of a float column are
+    stored as nan. A column falls back to a list once it meets any other
+    value, in which its empty cells are '' again. Short rows are padded
+    with empty cells.
+    """
+    rows = iter(rows)
+    names = next(rows, []) if header else []
+    columns = []
+    empty_rows = []
+    number_of_rows = 0
+    for row in rows:
+        number_of_columns = len(columns)
+        for index, value in enumerate(row):
+            if index < number_of_columns:
+                column = columns[index]
+                if column.__class__ is list:
+                    column.append(value)
+                elif _fits(column.typecode, value):
+                    column.append(value)
+                else:
+                    columns[index] = _add_value(
+                        column, value, empty_rows[index]
+                    )
+            else:
+                column = array("d", [NAN] * number_of_rows)
+                empty_rows.append(list(range(number_of_rows)))
+                if number_of_rows == 0 and _fits("q", value):
+                    column = array("q", [value])
+                else:
+                    column = _add_value(column, value, empty_rows[-1])
+                columns.append(column)
+        for index in range(len(row), len(columns)):
+            column = columns[index]
+            if column.__class__ is list:
+                column.append("")
+            else:
+                columns[index] = _add_value(column, "", empty_rows[index])
+        number_of_rows += 1
+    return OrderedDict(zip(_column_keys(names, len(columns)), columns))
+
+
+def _fits(typecode, value):
+    if typecode == "q":
+        return value.__class__ is int and MIN_INT64 <= value <= MAX_INT64
+    if value.__class__ is int:
+        return -MAX_FLOAT_INT <= value <= MAX_FLOAT_INT
+    return value.__class__ is float
+
+
+def _add_value(column, value, empty_rows):
+    """
+    append a value that does not fit the typecode of the column, which
+    is changed to a float column or a list when needed
+    """
+    if value.__class__ is str and value == "":
+        empty_rows.append(len(column))
+        value = NAN
+    elif not _fits("d", value):
+        column = column.tolist()
+        for index in empty_rows:
+            column[index] = ""
+        column.append(value)
+        return column
+
+    if column.typecode == "q":
+        if not all(-MAX_FLOAT_INT <= cell <= MAX_FLOAT_INT for cell in column):
+            column = column.tolist()
+            column.append("" if value is NAN else value)
+            return column
+        column = array("d", column)
+    column.append(value)
+    return column
+
+
+def _column_keys(names, number_of_columns):
+    """
+    the header names, or the column index for a missing, empty or
+    repeated name
+    """
+    keys = []
+    for index in range(number_of_columns):
+        key = names[index] if index < len(names) else ""
+        if key == "" or key is None or key in keys:
+            key = index
+        keys.append(key)
+    return keys
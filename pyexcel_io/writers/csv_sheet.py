@@ -11,6 +11,7 @@ The lower level csv file format writer
 import csv
 
 import pyexcel_io.constants as constants
+from pyexcel_io.utils import open_file, split_file_name
 from pyexcel_io.plugin_api import ISheetWriter
 
 
@@ -48,8 +49,8 @@ class CSVFileWriter(ISheetWriter):
 
     def get_writer(self):
         if self._sheet_name != constants.DEFAULT_SHEET_NAME:
-            names = self._native_book.rsplit(".", 1)
-            file_name = "%s%s%s%s%s.%s" % (
+            names = split_file_name(self._native_book)
+            file_name = "%s%s%s%s%s%s" % (
                 names[0],
                 constants.DEFAULT_MULTI_CSV_SEPARATOR,
                 self._sheet_name,  # sheet name
@@ -60,7 +61,7 @@ class CSVFileWriter(ISheetWriter):
         else:
             file_name = self._native_book
 
-        self.file_handle = open(
+        self.file_handle = open_file(
             file_name, "w", newline="", encoding=self._encoding
         )
         return csv.writer(self.file_handle, **self._keywords)
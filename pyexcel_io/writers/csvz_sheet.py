@@ -8,26 +8,71 @@ The lower level csvz file format handler.
 :license: New BSD License, see LICENSE for more details
 """
 
+import io
 import csv
+import time
+import codecs
+import zipfile
 
-from pyexcel_io._compact import StringIO
 from pyexcel_io.writers.csv_sheet import CSVFileWriter
 
+# what ZipFile.writestr gives a member: rw-------
+MEMBER_ATTRIBUTES = 0o600 << 16
+# io.TextIOWrapper leaves these out on a stream that cannot seek, and
+# encodes in the native byte order instead
+BYTE_ORDER_MARKS = {"utf-16": codecs.BOM_UTF16, "utf-32": codecs.BOM_UTF32}
+
 
 class CSVZipSheetWriter(CSVFileWriter):
-    """handle the zipfile interface"""
+    """
+    handle the zipfile interface
+
+    rows are encoded and compressed into the member as they are written
+    """
 
     def __init__(self, zipfile, sheetname, file_extension, **keywords):
         self.file_extension = file_extension
         keywords["single_sheet_in_book"] = False
-        self.content = StringIO()
         super().__init__(zipfile, sheetname, **keywords)
 
     def get_writer(self):
-        return csv.writer(self.content, **self._keywords)
+        file_name = "%s.%s" % (self._sheet_name, self.file_extension)
+        member = self._native_book.open(
+            _new_member_info(self._native_book, file_name),
+            "w",
+            force_zip64=True,
+        )
+        byte_order_mark = BYTE_ORDER_MARKS.get(
+            codecs.lookup(self._encoding).name
+        )
+        if byte_order_mark:
+            member.write(byte_order_mark)
+        self.file_handle = io.TextIOWrapper(
+            member, encoding=self._encoding, newline=""
+        )
+        return csv.writer(self.file_handle, **self._keywords)
 
     def close(self):
-        file_name = "%s.%s" % (self._sheet_name, self.file_extension)
-        self.content.seek(0)
-        self._native_book.writestr(file_name, self.content.read())
-        self.content.close()
+        # closes the member, which writes its sizes and crc
+        self.file_handle.close()
+
+
+def _new_member_info(book, file_name):
+    """
+    the member info that ZipFile.writestr would make, or the file name
+    when only ZipFile itself can give the member its compresslevel
+    """
+    if book.compresslevel is not None and not hasattr(
+        zipfile.ZipInfo, "compress_level"
+    ):
+        # compress_level is public from python 3.13 onwards
+        return file_name
+
+    member_info = zipfile.ZipInfo(
+        file_name, date_time=time.localtime(time.time())[:6]
+    )
+    member_info.compress_type = book.compression
+    if book.compresslevel is not None:
+        member_info.compress_level = book.compresslevel
+    member_info.external_attr = MEMBER_ATTRIBUTES
+    return member_info
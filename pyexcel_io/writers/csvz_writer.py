@@ -4,6 +4,17 @@ from pyexcel_io import constants
 from pyexcel_io.plugin_api import IWriter
 from pyexcel_io.writers.csvz_sheet import CSVZipSheetWriter
 
+COMPRESSIONS = {
+    "stored": zipfile.ZIP_STORED,
+    "deflated": zipfile.ZIP_DEFLATED,
+    "bzip2": zipfile.ZIP_BZIP2,
+    "lzma": zipfile.ZIP_LZMA,
+}
+if hasattr(zipfile, "ZIP_ZSTANDARD"):
+    # python 3.14 onwards
+    COMPRESSIONS["zstd"] = zipfile.ZIP_ZSTANDARD
+MESSAGE_INVALID_COMPRESSION = "compression should be one of %s but %s is given"
+
 
 class CsvZipWriter(IWriter):
     """
@@ -14,9 +25,21 @@ class CsvZipWriter(IWriter):
     any other unzip software.
     """
 
-    def __init__(self, file_name, file_type, **keywords):
+    def __init__(
+        self,
+        file_name,
+        file_type,
+        compression="deflated",
+        compresslevel=None,
+        **keywords
+    ):
         self._file_type = file_type
-        self.zipfile = zipfile.ZipFile(file_name, "w", zipfile.ZIP_DEFLATED)
+        zip_keywords = {}
+        if compresslevel is not None:
+            zip_keywords["compresslevel"] = compresslevel
+        self.zipfile = zipfile.ZipFile(
+            file_name, "w", _get_compression(compression), **zip_keywords
+        )
         self._keywords = keywords
         if file_type == constants.FILE_FORMAT_TSVZ:
             self._keywords["dialect"] = constants.KEYWORD_TSV_DIALECT
@@ -33,3 +56,17 @@ class CsvZipWriter(IWriter):
     def close(self):
         if self.zipfile:
             self.zipfile.close()
+
+
+def _get_compression(compression):
+    """the zipfile constant for a name, e.g. 'lzma', or the constant"""
+    if compression in COMPRESSIONS:
+        return COMPRESSIONS[compression]
+
+    if compression in COMPRESSIONS.values():
+        return compression
+
+    raise ValueError(
+        MESSAGE_INVALID_COMPRESSION
+        % (", ".join(sorted(COMPRESSIONS)), compression)
+    )
@@ -84,6 +84,7 @@ EXTRAS_REQUIRE = {
     "xls": ['pyexcel-xls>=0.6.0'],
     "xlsx": ['pyexcel-xlsx>=0.6.0'],
     "ods": ['pyexcel-ods3>=0.6.0'],
+    "numpy": ['numpy'],
 }
 # You do not need to read beyond this line
 PUBLISH_COMMAND = "{0} setup.py sdist bdist_wheel upload -r pypi".format(sys.executable)
@@ -0,0 +1,194 @@
+import os
+import time
+import shutil
+import tempfile
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+from pyexcel_io import get_data, save_data
+from pyexcel_io.cache import DiskCache, MemoryCache, make_key
+
+from .nose_tools import eq_, raises
+
+
+class TestDiskCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache_directory = os.path.join(self.directory, "cache")
+        self.file_name = os.path.join(self.directory, "reference.csv")
+        save_data(self.file_name, [[1, 2, 3], [4, 5, 6]])
+
+    def test_hit_does_not_read_the_file(self):
+        cache = DiskCache(self.cache_directory)
+        data = get_data(self.file_name, cache=cache)
+        with patch("pyexcel_io.io.Reader") as reader:
+            eq_(get_data(self.file_name, cache=cache), data)
+            self.assertFalse(reader.called)
+        eq_(cache.statistics()[:3], (1, 1, 0))
+
+    def test_options_are_in_the_key(self):
+        cache = DiskCache(self.cache_directory)
+        get_data(self.file_name, cache=cache)
+        data = get_data(self.file_name, cache=cache, start_row=1)
+        eq_(data["reference.csv"], [[4, 5, 6]])
+        eq_(cache.statistics().misses, 2)
+
+    def test_changed_file(self):
+        cache = DiskCache(self.cache_directory)
+        get_data(self.file_name, cache=cache)
+        save_data(self.file_name, [[7, 8], [9, 10], [11, 12]])
+        data = get_data(self.file_name, cache=cache)
+        eq_(data["reference.csv"], [[7, 8], [9, 10], [11, 12]])
+        eq_(cache.statistics().misses, 2)
+        eq_(len(os.listdir(self.cache_directory)), 1)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = DiskCache(self.cache_directory)
+        get_data(self.file_name, cache=cache)
+        get_data(self.file_name, cache=cache, start_row=1)
+        cache = DiskCache(self.cache_directory, cache.statistics().size)
+        for entry in os.listdir(self.cache_directory):
+            os.utime(os.path.join(self.cache_directory, entry), (0, 0))
+        # the first entry becomes the most recently used one
+        get_data(self.file_name, cache=cache)
+        get_data(self.file_name, cache=cache, row_limit=1)
+        eq_(cache.statistics().evictions, 1)
+        get_data(self.file_name, cache=cache)
+        get_data(self.file_name, cache=cache, row_limit=1)
+        eq_(cache.statistics()[:3], (3, 1, 1))
+
+    def test_functions_are_not_cached(self):
+        cache = DiskCache(self.cache_directory)
+        get_data(self.file_name, cache=cache, row_renderer=lambda row: row)
+        eq_(cache.statistics(), (0, 0, 0, 0))
+
+    def test_broken_entry(self):
+        cache = DiskCache(self.cache_directory)
+        data = get_data(self.file_name, cache=cache)
+        for entry in os.listdir(self.cache_directory):
+            with open(os.path.join(self.cache_directory, entry), "wb") as f:
+                f.write(b"broken")
+        eq_(get_data(self.file_name, cache=cache), data)
+        eq_(cache.statistics().misses, 2)
+
+    def test_key(self):
+        key = make_key(self.file_name, dict(column_types=[int, "text"]))
+        eq_(key.stamp[0], os.path.getsize(self.file_name))
+        eq_(make_key(self.file_name, dict(column_types=[int, "text"])), key)
+        self.assertNotEqual(make_key(self.file_name, dict(columns=[0])), key)
+        eq_(make_key(self.file_name, dict(column_types=[len])), None)
+        eq_(make_key("no such file.csv", {}), None)
+
+    @raises(ValueError)
+    def test_invalid_max_size(self):
+        DiskCache(self.cache_directory, max_size=0)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+
+class TestMemoryCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_name = os.path.join(self.directory, "reference.csv")
+        save_data(self.file_name, [[1, 2, 3], [4, 5, 6]])
+
+    def test_sheets_are_read_only(self):
+        cache = MemoryCache()
+        get_data(self.file_name, cache=cache)
+        data = get_data(self.file_name, cache=cache)
+        eq_(data["reference.csv"], ((1, 2, 3), (4, 5, 6)))
+        data["another"] = []
+        self.assertNotIn("another", get_data(self.file_name, cache=cache))
+        eq_(cache.statistics()[:3], (2, 1, 0))
+
+    def test_columns_are_read_only(self):
+        cache = MemoryCache()
+        data = get_data(self.file_name, cache=cache, layout="columns")
+        column = data["reference.csv"][1]
+        eq_(column.tolist(), [4])
+        with self.assertRaises(TypeError):
+            column[0] = 7
+        with self.assertRaises(TypeError):
+            data["reference.csv"][1] = [7, 8]
+
+    def test_changed_file(self):
+        cache = MemoryCache()
+        get_data(self.file_name, cache=cache)
+        save_data(self.file_name, [[7, 8], [9, 10], [11, 12]])
+        data = get_data(self.file_name, cache=cache)
+        eq_(data["reference.csv"], ((7, 8), (9, 10), (11, 12)))
+        eq_(cache.statistics()[:3], (0, 2, 0))
+
+    def test_ttl(self):
+        cache = MemoryCache(ttl=0.01)
+        get_data(self.file_name, cache=cache)
+        time.sleep(0.02)
+        get_data(self.file_name, cache=cache)
+        eq_(cache.statistics()[:3], (0, 2, 1))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = MemoryCache()
+        get_data(self.file_name, cache=cache)
+        cache = MemoryCache(max_size=cache.statistics().size * 2)
+        get_data(self.file_name, cache=cache)
+        get_data(self.file_name, cache=cache, start_row=1)
+        # the first entry becomes the most recently used one
+        get_data(self.file_name, cache=cache)
+        get_data(self.file_name, cache=cache, row_limit=1)
+        eq_(cache.statistics().evictions, 1)
+        get_data(self.file_name, cache=cache)
+        eq_(cache.statistics()[:3], (2, 3, 1))
+        self.assertLessEqual(cache.statistics().size, cache.max_size)
+
+    def test_concurrent_loads_read_the_file_once(self):
+        cache = MemoryCache()
+        key = make_key(self.file_name, {})
+        started = threading.Event()
+        release = threading.Event()
+        loads = []
+
+        def load():
+            loads.append(1)
+            started.set()
+            release.wait(5)
+            return get_data(self.file_name)
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(cache.load(key, load))
+            )
+            for _ in range(4)
+        ]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        # let the other threads find the load in progress
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+        eq_(len(loads), 1)
+        eq_(len(results), 4)
+        eq_(cache.statistics()[:2], (3, 1))
+
+    def test_failed_load(self):
+        cache = MemoryCache()
+        key = make_key(self.file_name, {})
+
+        def load():
+            raise IOError("unreadable")
+
+        with self.assertRaises(IOError):
+            cache.load(key, load)
+        eq_(cache.load(key, lambda: {"sheet": [[1]]}), {"sheet": ((1,),)})
+
+    @raises(ValueError)
+    def test_invalid_ttl(self):
+        MemoryCache(ttl=0)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
@@ -1,9 +1,12 @@
 import os
+import mmap
+from datetime import date
 from textwrap import dedent
 from unittest import TestCase
 
 import pyexcel_io.manager as manager
-from pyexcel_io import get_data
+import pyexcel_io.readers.csv_sheet as csv_sheet
+from pyexcel_io import get_data, iget_data, save_data
 from pyexcel_io.sheet import NamedContent
 from pyexcel_io.reader import EncapsulatedSheetReader
 from pyexcel_io._compact import BytesIO, StringIO
@@ -60,13 +63,11 @@ class TestWriter(TestCase):
         self.file_type = "csv"
         self.test_file = "csv_book." + self.file_type
         self.data = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
-        self.result = dedent(
-            """
+        self.result = dedent("""
            1,2,3
            4,5,6
            7,8,9
-        """
-        ).strip("\n")
+        """).strip("\n")
 
     def test_sheet_writer(self):
         w = CSVFileWriter(self.test_file, None)
@@ -86,13 +87,11 @@ class TestMemoryWriter(TestCase):
         self.file_type = "csv"
         self.test_file = "csv_book." + self.file_type
         self.data = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
-        self.result = dedent(
-            """
+        self.result = dedent("""
            1,2,3
            4,5,6
            7,8,9
-        """
-        ).strip("\n")
+        """).strip("\n")
 
     def test_sheet_writer_to_memory(self):
         io = manager.get_io(self.file_type)
@@ -138,6 +137,306 @@ class TestNonUniformCSV(TestCase):
         os.unlink(self.test_file)
 
 
+class TestSampleThenLock(TestCase):
+    def setUp(self):
+        self.test_file = "csv_book_with_sampling.csv"
+        self.data = [
+            ["1", "1.5", "a", "2015-08-17"],
+            ["2", "2.5", "b", "x"],
+            ["3", "0.5", "c", "y"],
+            ["007", "1e3", "10", "2015-08-18"],
+        ]
+        with open(self.test_file, "w") as f:
+            for row in self.data:
+                f.write(",".join(row) + "\n")
+
+    def test_infer_types(self):
+        result = get_data(self.test_file, infer_types="sample:2")
+        self.assertEqual(
+            result[self.test_file],
+            [
+                [1, 1.5, "a", date(2015, 8, 17)],
+                [2, 2.5, "b", "x"],
+                [3, 0.5, "c", "y"],
+                ["007", 1000.0, "10", date(2015, 8, 18)],
+            ],
+        )
+
+    def test_sample_all_rows(self):
+        expected = get_data(self.test_file)
+        result = get_data(self.test_file, infer_types="sample:100")
+        self.assertEqual(result, expected)
+
+    @raises(ValueError)
+    def test_invalid_infer_types(self):
+        get_data(self.test_file, infer_types="guess")
+
+    def tearDown(self):
+        os.unlink(self.test_file)
+
+
+class TestColumnTypes(TestCase):
+    def setUp(self):
+        self.test_file = "csv_book_with_schema.csv"
+        self.data = [
+            ["id", "code", "price", "day"],
+            ["1", "007", "1.5", "2015-08-17"],
+            ["2", "010", "2", ""],
+        ]
+        with open(self.test_file, "w") as f:
+            for row in self.data:
+                f.write(",".join(row) + "\n")
+
+    def test_column_types_by_name(self):
+        result = get_data(
+            self.test_file,
+            column_types={"id": int, "code": str, "price": float, "day": date},
+        )
+        self.assertEqual(
+            result[self.test_file],
+            [
+                ["id", "code", "price", "day"],
+                [1, "007", 1.5, date(2015, 8, 17)],
+                [2, "010", 2.0],
+            ],
+        )
+
+    def test_column_types_by_index(self):
+        result = get_data(
+            self.test_file,
+            start_row=1,
+            column_types=[lambda text: int(text) * 10, str],
+        )
+        self.assertEqual(
+            result[self.test_file],
+            [[10, "007", 1.5, date(2015, 8, 17)], [20, "010", 2]],
+        )
+
+    def test_none_means_auto_detection(self):
+        result = get_data(
+            self.test_file, column_types={"code": str, "price": None}
+        )
+        self.assertEqual(result[self.test_file][2], [2, "010", 2])
+
+    @raises(ValueError)
+    def test_unknown_column_name(self):
+        get_data(self.test_file, column_types={"cost": float})
+
+    @raises(ValueError)
+    def test_converter_error_is_raised(self):
+        get_data(self.test_file, column_types=[int])
+
+    def tearDown(self):
+        os.unlink(self.test_file)
+
+
+class TestConversionCache(TestCase):
+    def setUp(self):
+        self.test_file = "csv_book_with_repeated_values.csv"
+        self.data = [["GB", "1", "2015-08-17"], ["FR", "1", "2015-08-17"]] * 3
+        with open(self.test_file, "w") as f:
+            for row in self.data:
+                f.write(",".join(row) + "\n")
+
+    def test_cached_conversion(self):
+        sheet = CSVFileReader(
+            NamedContent("csv", self.test_file), conversion_cache=2
+        )
+        result = list(EncapsulatedSheetReader(sheet).to_array())
+        self.assertEqual(result, get_data(self.test_file)[self.test_file])
+        self.assertEqual(tuple(sheet.cache_info()), (14, 4, 2, 4))
+        self.assertIs(result[0][0], result[2][0])
+        sheet.close()
+
+    def test_cache_info_of_the_reader(self):
+        data, reader = iget_data(self.test_file, conversion_cache=2)
+        eq_(tuple(reader.cache_info()[self.test_file]), (0, 0, 2, 0))
+        list(data[self.test_file])
+        eq_(
+            reader.cache_info(),
+            {self.test_file: csv_sheet.CacheInfo(14, 4, 2, 4)},
+        )
+        reader.close()
+        data, reader = iget_data(self.test_file)
+        list(data[self.test_file])
+        eq_(reader.cache_info()[self.test_file].maxsize, 0)
+        reader.close()
+
+    def test_cache_with_infer_types(self):
+        result = get_data(
+            self.test_file, conversion_cache=1, infer_types="sample:1"
+        )
+        self.assertEqual(result, get_data(self.test_file))
+
+    @raises(ValueError)
+    def test_invalid_cache_size(self):
+        get_data(self.test_file, conversion_cache=0)
+
+    def tearDown(self):
+        os.unlink(self.test_file)
+
+
+class TestParallelReading(TestCase):
+    def setUp(self):
+        self.test_file = "csv_book_in_parallel.csv"
+        self.chunk_size = csv_sheet.CHUNK_SIZE
+        csv_sheet.CHUNK_SIZE = 64
+        notes = ["plain", '"a, b"', '"multi\nline"', '"say ""hi""\r\nok"']
+        with open(self.test_file, "w", newline="") as f:
+            f.write("id,note,day\r\n")
+            for index in range(100):
+                f.write(
+                    "%d,%s,2015-08-%02d\r\n"
+                    % (index, notes[index % 4], index % 28 + 1)
+                )
+
+    def test_record_boundaries(self):
+        boundaries = csv_sheet._find_record_boundaries(
+            self.test_file, 64, {}, "utf-8"
+        )
+        with open(self.test_file, "rb") as f:
+            content = f.read()
+        eq_(boundaries[1], len(b"id,note,day\r\n"))
+        eq_(boundaries[-1], len(content))
+        for boundary in boundaries[1:-1]:
+            eq_(content[:boundary].count(b'"') % 2, 0)
+            eq_(content[boundary - 1 : boundary], b"\n")  # noqa: E203
+
+    def test_workers(self):
+        expected = get_data(self.test_file)
+        eq_(get_data(self.test_file, workers=2), expected)
+
+    def test_workers_with_a_quote_in_an_unquoted_field(self):
+        with open(self.test_file, "w", newline="") as f:
+            f.write("id,note\r\n")
+            for index in range(40):
+                if index % 3 == 0:
+                    f.write('%d,5" screen\r\n' % index)
+                else:
+                    f.write('%d,"multi\nline %d"\r\n' % (index, index))
+        expected = get_data(self.test_file)
+        eq_(len(expected[self.test_file]), 41)
+        eq_(get_data(self.test_file, workers=2), expected)
+
+    def test_workers_with_a_newline_in_a_quoted_field(self):
+        with open(self.test_file, "w", newline="") as f:
+            f.write("id,note\r\n")
+            for index in range(40):
+                f.write('%d,"%s\r\n""quoted"", 5"" x"\r\n' % (index, "a" * 70))
+        expected = get_data(self.test_file)
+        eq_(len(expected[self.test_file]), 41)
+        eq_(get_data(self.test_file, workers=2), expected)
+
+    def test_workers_with_an_escape_character(self):
+        with open(self.test_file, "w", newline="") as f:
+            f.write("id,note\r\n")
+            for index in range(40):
+                f.write('%d,"a \\" b\nc"\r\n' % index)
+        keywords = dict(escapechar="\\", doublequote=False)
+        expected = get_data(self.test_file, **keywords)
+        eq_(len(expected[self.test_file]), 41)
+        eq_(get_data(self.test_file, workers=2, **keywords), expected)
+
+    def test_workers_with_a_carriage_return_in_a_line(self):
+        with open(self.test_file, "w", newline="") as f:
+            f.write("id,note\r")
+            for index in range(40):
+                f.write("%d,plain\r" % index)
+        expected = get_data(self.test_file)
+        eq_(len(expected[self.test_file]), 41)
+        eq_(get_data(self.test_file, workers=2), expected)
+
+    def test_workers_with_column_names(self):
+        keywords = dict(
+            columns=["day", "id"], column_types={"id": str}, start_row=1
+        )
+        expected = get_data(self.test_file, **keywords)
+        eq_(get_data(self.test_file, workers=2, **keywords), expected)
+
+    def test_early_close(self):
+        data, reader = iget_data(self.test_file, workers=2)
+        eq_(next(data[self.test_file]), ["id", "note", "day"])
+        reader.close()
+
+    @raises(ValueError)
+    def test_invalid_workers(self):
+        get_data(self.test_file, workers=0)
+
+    def tearDown(self):
+        csv_sheet.CHUNK_SIZE = self.chunk_size
+        os.unlink(self.test_file)
+
+
+class TestMemoryMappedFile(TestCase):
+    def setUp(self):
+        self.test_file = "csv_book_in_mmap.csv"
+        self.content = [
+            ["Äkkilähdöt", "multi\nline", "1"],
+            ["a,b", 'say "hi"', "2"],
+        ]
+        self.expected = [
+            ["Äkkilähdöt", "multi\nline", 1],
+            ["a,b", 'say "hi"', 2],
+        ]
+
+    def test_use_mmap(self):
+        for encoding in [
+            "utf-8",
+            "utf-8-sig",
+            "utf-16",
+            "utf-16-le",
+            "utf-16-be",
+            "utf-32",
+            "utf-32-le",
+            "utf-32-be",
+        ]:
+            save_data(self.test_file, self.content, encoding=encoding)
+            data = get_data(self.test_file, encoding=encoding, use_mmap=True)
+            eq_(data[self.test_file], self.expected)
+
+    def test_mmap_as_content(self):
+        save_data(self.test_file, self.content, encoding="utf-16")
+        with open(self.test_file, "rb") as f:
+            memory_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            data = get_data(memory_map, file_type="csv", encoding="utf-16")
+            memory_map.close()
+        eq_(data["csv"], self.expected)
+
+    def test_empty_file(self):
+        open(self.test_file, "w").close()
+        eq_(get_data(self.test_file, use_mmap=True)[self.test_file], [])
+
+    def test_use_mmap_is_ignored_for_a_stream(self):
+        save_data(self.test_file, self.content)
+        with open(self.test_file, "r", newline="") as csv_file:
+            data = get_data(csv_file, file_type="csv", use_mmap=True)
+        eq_(data["csv"], self.expected)
+        with open(self.test_file, "rb") as csv_file:
+            data = get_data(csv_file.read(), file_type="csv", use_mmap=True)
+        eq_(data["csv"], self.expected)
+
+    def test_use_mmap_is_ignored_for_csvz(self):
+        file_name = "csv_book_in_mmap.csvz"
+        save_data(self.test_file, self.content)
+        save_data(file_name, {"mmap": self.content})
+        try:
+            data = get_data(file_name, use_mmap=True)
+        finally:
+            os.unlink(file_name)
+        eq_(data["mmap"], self.expected)
+
+    def tearDown(self):
+        os.unlink(self.test_file)
+
+
+def test_bytes_like_content():
+    content = 'Äkkilähdöt,"multi\nline",1\r\n"a,b",2\r\n'.encode("utf-16")
+    expected = [["Äkkilähdöt", "multi\nline", 1], ["a,b", 2]]
+    for file_content in [content, bytearray(content), memoryview(content)]:
+        data = get_data(file_content, file_type="csv", encoding="utf-16")
+        eq_(data["csv"], expected)
+
+
 def test_utf16_decoding():
     test_file = os.path.join("tests", "fixtures", "csv-encoding-utf16.csv")
     reader = EncapsulatedSheetReader(
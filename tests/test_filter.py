@@ -77,3 +77,63 @@ class TestFilter(TestCase):
 
     def tearDown(self):
         os.unlink(self.test_file)
+
+
+class TestColumnProjection(TestCase):
+    def setUp(self):
+        self.test_file = "test_projection.csv"
+        sample = [
+            ["id", "name", "price"],
+            [1, "apple", 1.5],
+            [2, "pear", 2.5],
+        ]
+        save_data(self.test_file, sample)
+
+    def test_select_columns_by_index(self):
+        filtered_data = get_data(self.test_file, columns=[2, 0])
+        expected = [["price", "id"], [1.5, 1], [2.5, 2]]
+        eq_(filtered_data[self.test_file], expected)
+
+    def test_select_columns_by_name(self):
+        filtered_data = get_data(
+            self.test_file, columns=["price", 1], start_row=1
+        )
+        expected = [[1.5, "apple"], [2.5, "pear"]]
+        eq_(filtered_data[self.test_file], expected)
+
+    def test_selected_columns_are_converted_only(self):
+        converted = []
+
+        def track(text):
+            converted.append(text)
+            return text
+
+        get_data(
+            self.test_file,
+            columns=["name"],
+            column_types=[track, track, track],
+        )
+        eq_(converted, ["apple", "pear"])
+
+    def test_column_window_is_pushed_down(self):
+        converted = []
+
+        def track(text):
+            converted.append(text)
+            return text
+
+        filtered_data = get_data(
+            self.test_file,
+            start_column=1,
+            column_limit=1,
+            column_types=[track, track, track],
+        )
+        eq_(filtered_data[self.test_file], [["name"], ["apple"], ["pear"]])
+        eq_(converted, ["name", "apple", "pear"])
+
+    def test_unknown_column_name(self):
+        with self.assertRaises(ValueError):
+            get_data(self.test_file, columns=["cost"])
+
+    def tearDown(self):
+        os.unlink(self.test_file)
@@ -0,0 +1,70 @@
+import numpy
+from pyexcel_io import get_array
+from pyexcel_io._compact import StringIO
+
+from .nose_tools import eq_, raises
+
+CONTENT = "id,price,day\n1,2.5,2015-08-17\n2,,2015-08-18\n3,4\n"
+
+
+def test_get_array_of_floats():
+    array = get_array(StringIO(CONTENT), start_row=1, columns=[0, 1])
+    eq_(array.dtype, numpy.float64)
+    eq_(array.shape, (3, 2))
+    eq_(array[0].tolist(), [1.0, 2.5])
+    assert numpy.isnan(array[1, 1])
+
+
+def test_get_array_in_batches():
+    expected = get_array(StringIO(CONTENT), start_row=1, columns=[0, 1])
+    array = get_array(
+        StringIO(CONTENT), start_row=1, columns=["id", "price"], batch_size=1
+    )
+    numpy.testing.assert_array_equal(array, expected)
+
+
+def test_get_structured_array():
+    dtype = [("id", "i8"), ("price", "f8"), ("day", "datetime64[D]")]
+    array = get_array(StringIO(CONTENT), dtype=dtype, start_row=1)
+    eq_(array["id"].tolist(), [1, 2, 3])
+    eq_(array["day"][0], numpy.datetime64("2015-08-17"))
+    assert numpy.isnat(array["day"][2])
+
+
+def test_get_array_from_nothing():
+    eq_(get_array(StringIO(""), file_type="csv").shape, (0, 0))
+
+
+@raises(ValueError)
+def test_get_array_of_text_as_float():
+    get_array(StringIO(CONTENT))
+
+
+def test_get_array_with_a_wider_batch_later():
+    content = "1,2\n3,4\n5,6,7\n"
+    expected = get_array(StringIO(content), file_type="csv", batch_size=10)
+    eq_(expected.shape, (3, 3))
+    array = get_array(StringIO(content), file_type="csv", batch_size=2)
+    numpy.testing.assert_array_equal(array, expected)
+    assert numpy.isnan(array[0, 2])
+
+
+def test_get_structured_array_with_a_wider_batch_later():
+    dtype = [("a", "i8"), ("b", "i8")]
+    content = StringIO("1,2\n3,4\n5,6,7\n")
+    array = get_array(content, dtype=dtype, file_type="csv", batch_size=2)
+    eq_(array["b"].tolist(), [2, 4, 6])
+
+
+def test_get_structured_array_with_short_rows():
+    dtype = [("a", "f8"), ("b", "f8")]
+    for batch_size in (1, 10):
+        array = get_array(
+            StringIO("1\n2,3\n"),
+            dtype=dtype,
+            file_type="csv",
+            batch_size=batch_size,
+        )
+        eq_(array["a"].tolist(), [1.0, 2.0])
+        assert numpy.isnan(array["b"][0])
+        eq_(array["b"][1], 3.0)
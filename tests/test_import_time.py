@@ -0,0 +1,76 @@
+import os
+import sys
+import subprocess
+
+import pyexcel_io
+
+from .nose_tools import eq_, raises
+
+# modules that are imported when a format is read or written
+LAZY_MODULES = [
+    "pyexcel_io.io",
+    "pyexcel_io.cache",
+    "pyexcel_io.reader",
+    "pyexcel_io.sheet",
+    "pyexcel_io.service",
+    "chardet",
+    "numpy",
+    "csv",
+    "datetime",
+    "zipfile",
+    "pickle",
+    "tempfile",
+    "pkgutil",
+    "hashlib",
+]
+# the packages of the readers and writers, whose modules are imported
+# when a format is read or written
+LAZY_PACKAGES = ["pyexcel_io.readers.", "pyexcel_io.writers."]
+
+
+def run_python(code, *options):
+    environment = dict(os.environ)
+    # the third party plugins are not imported
+    environment["PYEXCEL_IO_PLUGINS"] = ""
+    environment["PYTHONPATH"] = os.path.dirname(
+        os.path.dirname(os.path.abspath(pyexcel_io.__file__))
+    )
+    return subprocess.run(
+        [sys.executable] + list(options) + ["-c", code],
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def imported_modules():
+    output = run_python("import sys, pyexcel_io; print(*sys.modules)")
+    return set(output.stdout.split())
+
+
+def test_formats_are_not_imported():
+    imported = imported_modules()
+    eq_(imported.intersection(LAZY_MODULES), set())
+    eq_(
+        [
+            module_name
+            for module_name in imported
+            if module_name.startswith(tuple(LAZY_PACKAGES))
+        ],
+        [],
+    )
+
+
+def test_lazy_functions():
+    from pyexcel_io import get_data
+    from pyexcel_io.io import get_data as io_get_data
+
+    eq_(get_data, io_get_data)
+    eq_(pyexcel_io.io.get_data, io_get_data)
+    assert "save_data" in dir(pyexcel_io)
+
+
+@raises(AttributeError)
+def test_unknown_attribute():
+    pyexcel_io.no_such_function
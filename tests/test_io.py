@@ -1,12 +1,18 @@
+import gc
 import os
 import types
+import threading
+from math import isnan
+from array import array
 from zipfile import BadZipfile
 from unittest import TestCase
+from unittest.mock import patch
 
 import pyexcel_io.manager as manager
 import pyexcel_io.exceptions as exceptions
-from pyexcel_io import get_data, iget_data, save_data
+from pyexcel_io import get_data, iget_data, save_data, iget_batches
 from pyexcel_io.io import load_data, get_writer
+from pyexcel_io.utils import to_columns
 from pyexcel_io._compact import BytesIO, StringIO, OrderedDict, is_string
 
 from .nose_tools import eq_, raises
@@ -157,6 +163,35 @@ def test_get_io_type():
     eq_(t, "bytes")
 
 
+def test_file_types_are_registered_once():
+    manager.register_a_file_type("csv", "text", None)
+    eq_(manager.FILE_TYPES.count("csv"), 1)
+    eq_(manager.TEXT_STREAM_TYPES.count("csv"), 1)
+    eq_(manager.get_io_type("CSV"), "string")
+
+
+def test_plugin_lookup_is_renewed_by_a_registration():
+    from pyexcel_io.plugins import NEW_READERS, IOPluginInfo
+    from pyexcel_io.readers.csv_in_file import FileReader
+
+    @raises(exceptions.NoSupportingPluginFound)
+    def get_unknown_plugin():
+        NEW_READERS.get_a_plugin("renewed", location="file")
+
+    get_unknown_plugin()
+    NEW_READERS.register_a_plugin(
+        FileReader,
+        IOPluginInfo(
+            NEW_READERS.plugin_name,
+            None,
+            file_types=["file-renewed"],
+            stream_type="text",
+        ),
+    )
+    eq_(NEW_READERS.get_a_plugin("renewed", location="file"), FileReader)
+    eq_(NEW_READERS.get_a_plugin("renewed", location="file"), FileReader)
+
+
 def test_default_csv_format():
     data = [["1", "2", "3"]]
     io = manager.get_io("csv")
@@ -212,6 +247,56 @@ def test_file_handle_as_output():
     os.unlink("file_handle.csv")
 
 
+def test_pipe_as_input():
+    read_fd, write_fd = os.pipe()
+    first_row_read = threading.Event()
+    streamed = []
+
+    def write_rows():
+        with os.fdopen(write_fd, "wb") as pipe:
+            pipe.write(b"1,2,3\n")
+            pipe.flush()
+            # the reader should not wait for the end of the pipe
+            streamed.append(first_row_read.wait(5))
+            pipe.write(b"4,5,6\n")
+
+    writer = threading.Thread(target=write_rows)
+    writer.start()
+    with os.fdopen(read_fd, "rb") as pipe:
+        sheets, _ = iget_data(pipe, "csv")
+        rows = sheets["csv"]
+        eq_(next(rows), [1, 2, 3])
+        first_row_read.set()
+        eq_(list(rows), [[4, 5, 6]])
+    writer.join()
+    eq_(streamed, [True])
+
+
+def test_compressed_csv_files():
+    data = [[1, "中文", 2.5], [3, "", 4]]
+    for file_name, magic_number in (
+        ("compressed.csv.gz", b"\x1f\x8b"),
+        ("compressed.csv.bz2", b"BZh"),
+        ("compressed.csv.xz", b"\xfd7zXZ"),
+        ("compressed.tsv.gz", b"\x1f\x8b"),
+    ):
+        save_data(file_name, data)
+        with open(file_name, "rb") as f:
+            eq_(f.read(len(magic_number)), magic_number)
+        eq_(get_data(file_name)[file_name], [[1, "中文", 2.5], [3, "", 4]])
+        os.unlink(file_name)
+
+
+def test_compressed_csv_book():
+    data = OrderedDict()
+    data["sheet1"] = [[1, 2]]
+    data["sheet2"] = [[3, 4]]
+    save_data("book.csv.gz", data)
+    eq_(get_data("book.csv.gz"), data)
+    for index, name in enumerate(data):
+        os.unlink("book__%s__%d.csv.gz" % (name, index))
+
+
 def test_binary_file_content():
     data = [["1", "2", "3"]]
     io = manager.get_io("csvz")
@@ -254,6 +339,29 @@ def test_conversion_from_bytes_to_text():
     os.unlink(test_file)
 
 
+def test_quoted_line_break_in_bytes_content():
+    content = b'a,"x\r\ny"\r\nb,c\r\n'
+    for file_content in (content, bytearray(content), memoryview(content)):
+        result = get_data(file_content, file_type="csv")
+        eq_(result["csv"], [["a", "x\r\ny"], ["b", "c"]])
+
+
+def test_bytesio_is_decoded_as_it_is_read():
+    upload = BytesIO('a,"b\r\nc"\r\n1,é\r\n'.encode("utf-8"))
+    result = get_data(upload, "csv")
+    eq_(result["csv"], [["a", "b\r\nc"], [1, "é"]])
+    assert not upload.closed
+
+
+def test_bytesio_is_left_open_by_an_unfinished_iteration():
+    upload = BytesIO(b"1,2\n3,4\n")
+    sheets, reader = iget_data(upload, "csv")
+    eq_(next(sheets["csv"]), [1, 2])
+    del sheets, reader
+    gc.collect()
+    assert not upload.closed
+
+
 def test_is_string():
     assert is_string(type("a")) is True
 
@@ -276,6 +384,161 @@ def test_generator_can_be_written():
     os.unlink(test_filename)
 
 
+def test_iget_batches():
+    test_fixture = os.path.join("tests", "fixtures", "test.csv")
+    expected = get_data(test_fixture)["test.csv"]
+    data, reader = iget_batches(test_fixture, batch_size=2)
+    batches = list(data["test.csv"])
+    reader.close()
+    assert all(len(batch) <= 2 for batch in batches)
+    eq_(sum(batches, []), expected)
+
+
+def test_iget_batches_as_get_data():
+    content = "id,price,note,\n1,1.5,a,\n,,\n2,2.5\n3,1e3,c,d\n" * 2
+    keyword_sets = [
+        {},
+        {"start_row": 2, "row_limit": 3},
+        {"skip_empty_rows": True, "row_renderer": tuple},
+        {"keep_trailing_empty_cells": True},
+        {"auto_detect_int": False, "auto_detect_float": False},
+        {"infer_types": "sample:2", "conversion_cache": 4},
+        {"columns": ["note"]},
+        {"start_column": 1},
+    ]
+    for keywords in keyword_sets:
+        expected = get_data(StringIO(content), file_type="csv", **keywords)
+        for batch_size in (1, 3, 100):
+            data, reader = iget_batches(
+                StringIO(content),
+                file_type="csv",
+                batch_size=batch_size,
+                **keywords
+            )
+            batches = list(data["csv"])
+            reader.close()
+            assert all(len(batch) == batch_size for batch in batches[:-1])
+            assert 0 < len(batches[-1]) <= batch_size
+            eq_(sum(batches, []), expected["csv"])
+
+
+def test_iget_batches_of_csv_are_converted_in_blocks():
+    from pyexcel_io.readers.csv_sheet import CSVSheetReader
+
+    with patch.object(
+        CSVSheetReader, "column_iterator", side_effect=AssertionError
+    ):
+        data, reader = iget_batches(
+            StringIO("1,a\n2,b\n3,c\n"), file_type="csv", batch_size=2
+        )
+        eq_(list(data["csv"]), [[[1, "a"], [2, "b"]], [[3, "c"]]])
+        reader.close()
+
+
+def test_iget_batches_converts_only_the_selected_rows():
+    from pyexcel_io.readers.csv_sheet import CSVSheetReader
+
+    converted = []
+
+    def convert_rows(sheet, rows):
+        converted.extend(rows)
+        return [[int(cell) for cell in row] for row in rows]
+
+    content = "".join("%d\n" % index for index in range(10))
+    with patch.object(
+        CSVSheetReader,
+        "_convert_rows",
+        autospec=True,
+        side_effect=convert_rows,
+    ):
+        data, reader = iget_batches(
+            StringIO(content),
+            file_type="csv",
+            batch_size=3,
+            start_row=2,
+            row_limit=5,
+        )
+        eq_(list(data["csv"]), [[[2], [3], [4]], [[5], [6]]])
+        reader.close()
+    eq_(converted, [["2"], ["3"], ["4"], ["5"], ["6"]])
+
+
+@raises(ValueError)
+def test_iget_batches_needs_a_positive_batch_size():
+    test_fixture = os.path.join("tests", "fixtures", "test.csv")
+    iget_batches(test_fixture, batch_size=0)
+
+
+def test_get_data_in_columns():
+    content = "id,price,note\n1,1.5,a\n2,2.5\n3,1e3,c,d\n"
+    data = get_data(StringIO(content), layout="columns")
+    columns = data["csv"]
+    eq_(list(columns.keys()), ["id", "price", "note", 3])
+    eq_(columns["id"], array("q", [1, 2, 3]))
+    eq_(columns["price"], array("d", [1.5, 2.5, 1000.0]))
+    eq_(columns["note"], ["a", "", "c"])
+    eq_(columns[3], ["", "", "d"])
+
+
+def test_get_data_in_columns_without_header():
+    content = "1,1.5\n2,2.5\n"
+    data = get_data(StringIO(content), layout="columns", header=False)
+    eq_(list(data["csv"].keys()), [0, 1])
+    eq_(data["csv"][0], array("q", [1, 2]))
+    eq_(data["csv"][1], array("d", [1.5, 2.5]))
+
+
+def test_to_columns_uses_typed_arrays():
+    columns = to_columns([[1, 1.5, 1, "a"], [2, 2.5, 0.5], [3, 3.5, 2**63]])
+    eq_(columns[0], array("q", [1, 2, 3]))
+    eq_(columns[1], array("d", [1.5, 2.5, 3.5]))
+    eq_(columns[2], [1, 0.5, 2**63])
+    eq_(columns[3], ["a", "", ""])
+    assert isinstance(to_columns([[True]])[0], list)
+
+
+def test_to_columns_with_header():
+    columns = to_columns([["a", "", "a"], [1, 2, 3, 4]], header=True)
+    eq_(list(columns.keys()), ["a", 1, 2, 3])
+    eq_(columns["a"], array("q", [1]))
+    eq_(to_columns([], header=True), OrderedDict())
+
+
+def test_int_column_becomes_float_column():
+    columns = to_columns([[1, 1.5], [2.5, 2], [3, 3]])
+    eq_(columns[0], array("d", [1.0, 2.5, 3.0]))
+    eq_(columns[1], array("d", [1.5, 2.0, 3.0]))
+    columns = to_columns([[2**60], [0.5]])
+    eq_(columns[0], [2**60, 0.5])
+
+
+def test_empty_cells_of_a_number_column_are_nan():
+    columns = to_columns([[1, 1.5, ""], [""], [3, "", 2]])
+    eq_([column.typecode for column in columns.values()], ["d"] * 3)
+    eq_(columns[0][::2].tolist(), [1.0, 3.0])
+    assert isnan(columns[0][1])
+    eq_(columns[1][0], 1.5)
+    assert all(isnan(value) for value in columns[1][1:])
+    assert all(isnan(value) for value in columns[2][:2])
+    eq_(columns[2][2], 2.0)
+
+
+def test_empty_cells_of_a_text_column_are_kept():
+    eq_(to_columns([[1], [""], ["x"]])[0], [1, "", "x"])
+    eq_(to_columns([[""], [1.5], [True]])[0], ["", 1.5, True])
+    eq_(to_columns([[1], [2, "a"]])[1], ["", "a"])
+
+
+@raises(ValueError)
+def test_unknown_layout():
+    get_data(StringIO("1,2"), file_type="csv", layout="cells")
+
+
+@raises(ValueError)
+def test_columns_layout_cannot_be_streamed():
+    iget_data(StringIO("1,2"), file_type="csv", layout="columns")
+
+
 class TestReadMultipleSheets(TestCase):
     file_type = "csv"
     delimiter = ","
@@ -162,29 +162,22 @@ class TestTSVBookReaders(TestReadMultipleSheets):
 class TestWriteMultipleSheets(TestCase):
     file_type = "csv"
 
-    result1 = dedent(
-        """
+    result1 = dedent("""
         1,2,3
         4,5,6
         7,8,9
-        """
-    ).strip("\n")
-    result2 = dedent(
-        """
+        """).strip("\n")
+    result2 = dedent("""
         1,2,3
         4,5,6
         7,8,1000
-        """
-    ).strip("\n")
-    result3 = dedent(
-        """
+        """).strip("\n")
+    result3 = dedent("""
         1,2,3
         4,5,6888
         7,8,9
-        """
-    ).strip("\n")
-    merged = dedent(
-        """\
+        """).strip("\n")
+    merged = dedent("""\
         ---pyexcel:sheet1---
         1,2,3
         4,5,6
@@ -200,8 +193,7 @@ class TestWriteMultipleSheets(TestCase):
         4,5,6888
         7,8,9
         ---pyexcel---
-        """
-    )
+        """)
 
     def writer_class(self):
         return Writer(self.file_type)
@@ -268,6 +260,20 @@ class TestWriteMultipleSheets(TestCase):
             sheets[sheet] = list(sheets[sheet])
         self.assertEqual(sheets, self.expected_sheets)
 
+    def test_multiple_sheets_are_read_in_turns(self):
+        """Each sheet is a view of the same stream"""
+        io = manager.get_io(self.file_type)
+        io.write(self.merged)
+        reader = self.reader_class()
+        reader.open_stream(io, lineterminator="\n", multiple_sheets=True)
+        sheet3 = reader.read_sheet_by_name("sheet3")["sheet3"]
+        sheet1 = reader.read_sheet_by_index(0)["sheet1"]
+        self.assertEqual(next(sheet3), self.expected_data3[0])
+        self.assertEqual(next(sheet1), self.expected_data1[0])
+        self.assertEqual(list(sheet3), self.expected_data3[1:])
+        self.assertEqual(list(sheet1), self.expected_data1[1:])
+        reader.close()
+
     def delete_files(self):
         index = 0
         for key, value in self.sheets.items():
@@ -279,29 +285,22 @@ class TestWriteMultipleSheets(TestCase):
 class TestTSVWriteMultipleSheets(TestWriteMultipleSheets):
     file_type = "tsv"
 
-    result1 = dedent(
-        """
+    result1 = dedent("""
         1\t2\t3
         4\t5\t6
         7\t8\t9
-        """
-    ).strip("\n")
-    result2 = dedent(
-        """
+        """).strip("\n")
+    result2 = dedent("""
         1\t2\t3
         4\t5\t6
         7\t8\t1000
-        """
-    ).strip("\n")
-    result3 = dedent(
-        """
+        """).strip("\n")
+    result3 = dedent("""
         1\t2\t3
         4\t5\t6888
         7\t8\t9
-        """
-    ).strip("\n")
-    merged = dedent(
-        """\
+        """).strip("\n")
+    merged = dedent("""\
         ---pyexcel:sheet1---
         1\t2\t3
         4\t5\t6
@@ -317,20 +316,17 @@ class TestTSVWriteMultipleSheets(TestWriteMultipleSheets):
         4\t5\t6888
         7\t8\t9
         ---pyexcel---
-        """
-    )
+        """)
 
 
 class TestWriter(TestCase):
     file_type = "csv"
 
-    result = dedent(
-        """
+    result = dedent("""
         1,2,3
         4,5,6
         7,8,9
-        """
-    ).strip("\n")
+        """).strip("\n")
 
     def writer_class(self):
         return Writer(self.file_type)
@@ -355,25 +351,21 @@ class TestWriter(TestCase):
 class TestTSVWriters(TestWriter):
     file_type = "tsv"
 
-    result = dedent(
-        """
+    result = dedent("""
         1\t2\t3
         4\t5\t6
         7\t8\t9
-        """
-    ).strip("\n")
+        """).strip("\n")
 
 
 class TestMemoryWriter(TestCase):
     file_type = "csv"
 
-    result = dedent(
-        """
+    result = dedent("""
            1,2,3
            4,5,6
            7,8,9
-        """
-    ).strip("\n")
+        """).strip("\n")
 
     def writer_class(self):
         return Writer(self.file_type)
@@ -395,10 +387,8 @@ class TestMemoryWriter(TestCase):
 class TestTSVMemoryWriter(TestMemoryWriter):
     file_type = "tsv"
 
-    result = dedent(
-        """
+    result = dedent("""
            1\t2\t3
            4\t5\t6
            7\t8\t9
-        """
-    ).strip("\n")
+        """).strip("\n")
@@ -1,13 +1,15 @@
 # -*- coding: utf-8 -*-
 import os
+import codecs
 import zipfile
+import threading
 from unittest import TestCase
 
 import pyexcel_io.manager as manager
-from pyexcel_io import save_data
+from pyexcel_io import get_data, iget_data, save_data
 from pyexcel_io.reader import Reader
 from pyexcel_io.writer import Writer
-from pyexcel_io._compact import OrderedDict
+from pyexcel_io._compact import BytesIO, StringIO, OrderedDict
 
 from .nose_tools import raises
 
@@ -61,6 +63,52 @@ class TestCSVZ(TestCase):
         self.assertEqual(list(data["something"]), [["中", "文", 1, 2, 3]])
         zipreader.close()
 
+    def test_reading_with_given_encoding(self):
+        zip = zipfile.ZipFile(self.file, "w")
+        zip.writestr("chinese.ext", self.result.encode("gb18030"))
+        zip.close()
+        zipreader = self.reader_class()
+        zipreader.open(self.file, encoding="gb18030")
+        data = zipreader.read_all()
+        self.assertEqual(list(data["chinese"]), [["中", "文", 1, 2, 3]])
+        zipreader.close()
+
+    def test_writing_utf16(self):
+        data = [["中", "文", 1, 2, 3]]
+        file_name = "pyexcel_sheet1." + self.file_type[0:3]
+        zipbook = self.writer_class()
+        zipbook.open(self.file, encoding="utf-16")
+        zipbook.write({None: data})
+        zipbook.close()
+        with zipfile.ZipFile(self.file, "r") as zip:
+            content = zip.read(file_name)
+        self.assertEqual(content[:2], codecs.BOM_UTF16)
+        content = content.decode("utf-16")
+        self.assertEqual(content.replace("\r", "").strip("\n"), self.result)
+
+    def test_member_info(self):
+        zipbook = self.writer_class()
+        zipbook.open(self.file)
+        zipbook.write({None: [[1, 2]]})
+        zipbook.close()
+        with zipfile.ZipFile(self.file, "r") as zip:
+            member_info = zip.infolist()[0]
+            self.assertIsNone(zip.testzip())
+        self.assertEqual(member_info.compress_type, zipfile.ZIP_DEFLATED)
+        self.assertEqual(member_info.external_attr >> 16, 0o600)
+        self.assertGreater(member_info.date_time[0], 1980)
+
+    def test_writing_with_compresslevel(self):
+        data = [["中", "文", 1, 2, 3]] * 1000
+        sizes = []
+        for level in (0, 9):
+            zipbook = self.writer_class()
+            zipbook.open(self.file, compresslevel=level)
+            zipbook.write({None: data})
+            zipbook.close()
+            sizes.append(os.path.getsize(self.file))
+        self.assertGreater(sizes[0], sizes[1])
+
     def tearDown(self):
         os.unlink(self.file)
 
@@ -137,6 +185,25 @@ class TestMultipleSheet(TestCase):
             list(sheets["Sheet 1"]), [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
         )
 
+    def test_members_are_opened_when_iterated(self):
+        reader = self.reader_class()
+        reader.open(self.file_name)
+        opened = []
+        zip_file = reader.reader.zipfile
+        open_member = zip_file.open
+
+        def record_open(name, *args, **keywords):
+            opened.append(name)
+            return open_member(name, *args, **keywords)
+
+        zip_file.open = record_open
+        sheets = reader.read_all()
+        self.assertEqual(opened, [])
+        next(sheets["Sheet 2"])
+        self.assertEqual(len(opened), 1)
+        self.assertTrue(opened[0].startswith("Sheet 2."))
+        reader.close()
+
     @raises(IndexError)
     def test_read_one_from_many_by_unknown_index(self):
         reader = self.reader_class()
@@ -152,3 +219,92 @@ class TestMultipleTSVSheet(TestMultipleSheet):
 
     def reader_class(self):
         return Reader("tsvz")
+
+
+class ForwardOnlyStream(object):
+    """a pipe alike: it can neither seek nor tell"""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def read(self, size=-1):
+        return self.stream.read(size)
+
+    def write(self, data):
+        return self.stream.write(data)
+
+    def flush(self):
+        pass
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+
+class TestForwardOnlyStream(TestCase):
+    def setUp(self):
+        self.sheets = OrderedDict()
+        self.sheets["first"] = [["中", "文", 1], ["a\nb", 2, 3]]
+        self.sheets["second"] = [[4, 5, 6]]
+        self.sheets["third"] = [["x", "y"]]
+
+    def make_csvz(self, forward_only_writer=False):
+        io = BytesIO()
+        target = ForwardOnlyStream(io) if forward_only_writer else io
+        with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as archive:
+            for name, rows in self.sheets.items():
+                content = StringIO()
+                save_data(content, rows, file_type="csv")
+                archive.writestr(name + ".csv", content.getvalue())
+        io.seek(0)
+        return ForwardOnlyStream(io)
+
+    def test_read_all(self):
+        for forward_only_writer in [False, True]:
+            stream = self.make_csvz(forward_only_writer)
+            data = get_data(stream, file_type="csvz")
+            self.assertEqual(data, self.sheets)
+
+    def test_first_sheet_is_streamed(self):
+        stream = self.make_csvz()
+        data, reader = iget_data(stream, file_type="csvz", sheet_index=0)
+        self.assertEqual(list(data["first"]), self.sheets["first"])
+        # nothing beyond the first member has been read
+        self.assertEqual(stream.read(4), b"PK\x03\x04")
+        reader.close()
+
+    def test_later_sheet(self):
+        stream = self.make_csvz()
+        data = get_data(stream, file_type="csvz", sheet_name="third")
+        self.assertEqual(data["third"], self.sheets["third"])
+
+    def test_first_row_arrives_before_the_pipe_ends(self):
+        read_fd, write_fd = os.pipe()
+        first_row_read = threading.Event()
+        streamed = []
+
+        def write_sheets():
+            with os.fdopen(write_fd, "wb") as pipe:
+                archive = zipfile.ZipFile(pipe, "w", zipfile.ZIP_DEFLATED)
+                with archive:
+                    archive.writestr("first.csv", "1,2,3\n4,5,6\n")
+                    pipe.flush()
+                    # the reader should not wait for the end of the pipe
+                    streamed.append(first_row_read.wait(5))
+                    archive.writestr("second.csv", "7,8\n")
+
+        writer = threading.Thread(target=write_sheets)
+        writer.start()
+        with os.fdopen(read_fd, "rb") as pipe:
+            data, reader = iget_data(pipe, file_type="csvz")
+            rows = data["first"]
+            self.assertEqual(next(rows), [1, 2, 3])
+            first_row_read.set()
+            self.assertEqual(list(rows), [[4, 5, 6]])
+            self.assertEqual(list(data), ["first", "second"])
+            self.assertEqual(list(data["second"]), [[7, 8]])
+            reader.close()
+        writer.join()
+        self.assertEqual(streamed, [True])
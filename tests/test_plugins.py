@@ -0,0 +1,141 @@
+import os
+import sys
+import shutil
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from pyexcel_io import plugins
+
+from .nose_tools import eq_
+
+PATTERN = "^pyexcel_.*$"
+
+
+class TestLoadPlugins(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.package_directory = os.path.join(self.directory, "packages")
+        os.mkdir(self.package_directory)
+        self.environment = patch.dict(
+            os.environ,
+            {plugins.MANIFEST_DIRECTORY_VARIABLE: self.directory},
+        )
+        self.environment.start()
+        os.environ.pop(plugins.PLUGINS_VARIABLE, None)
+        self.path = patch.object(
+            sys, "path", sys.path + [self.package_directory]
+        )
+        self.path.start()
+
+    def load_plugins(self):
+        """whether the installed packages were scanned, and the imports"""
+        scans = []
+
+        def iter_modules(entries=None):
+            if entries is None or self.package_directory in entries:
+                scans.append(entries)
+                return [(None, "pyexcel_found", True)]
+            return []
+
+        with patch("pkgutil.iter_modules", iter_modules), patch(
+            "pyexcel_io.plugins.do_import"
+        ) as imports:
+            plugins.load_plugins(
+                PATTERN, [], ["pyexcel_io"], ["pyexcel_io.readers"]
+            )
+        imported = [call[0][0] for call in imports.call_args_list]
+        return len(scans) > 0, imported
+
+    def test_manifest_is_used_until_the_path_changes(self):
+        eq_(
+            self.load_plugins(),
+            (True, ["pyexcel_found", "pyexcel_io.readers"]),
+        )
+        eq_(
+            self.load_plugins(),
+            (False, ["pyexcel_found", "pyexcel_io.readers"]),
+        )
+        os.mkdir(os.path.join(self.package_directory, "pyexcel_new"))
+        eq_(self.load_plugins()[0], True)
+
+    def test_writes_in_the_current_directory_are_ignored(self):
+        work_directory = os.path.join(self.directory, "work")
+        os.mkdir(work_directory)
+        current_directory = os.getcwd()
+        os.chdir(work_directory)
+        try:
+            with patch.object(sys, "path", [""] + sys.path):
+                eq_(self.load_plugins()[0], True)
+                with open("notes.csv", "w") as csv_file:
+                    csv_file.write("1,2")
+                os.mkdir("pyexcel_output")
+                eq_(self.load_plugins()[0], False)
+        finally:
+            os.chdir(current_directory)
+
+    def test_site_directory_is_known_by_its_distributions(self):
+        with patch(
+            "site.getsitepackages", return_value=[self.package_directory]
+        ):
+            eq_(self.load_plugins()[0], True)
+            with open(os.path.join(self.package_directory, "a.py"), "w"):
+                pass
+            eq_(self.load_plugins()[0], False)
+            os.mkdir(
+                os.path.join(self.package_directory, "pyexcel_new.dist-info")
+            )
+            eq_(self.load_plugins()[0], True)
+            eq_(self.load_plugins()[0], False)
+
+    def test_plugins_in_the_current_directory(self):
+        plugin_directory = os.path.join(self.directory, "plugin")
+        os.makedirs(os.path.join(plugin_directory, "pyexcel_localplug"))
+        with open(
+            os.path.join(plugin_directory, "pyexcel_localplug", "__init__.py"),
+            "w",
+        ):
+            pass
+        current_directory = os.getcwd()
+        try:
+            with patch.object(sys, "path", [""] + sys.path):
+                for directory in [self.directory, plugin_directory]:
+                    os.chdir(directory)
+                    with patch("pyexcel_io.plugins.do_import") as imports:
+                        plugins.load_plugins(PATTERN, [], [], [])
+                    imported = [call[0][0] for call in imports.call_args_list]
+        finally:
+            os.chdir(current_directory)
+        self.assertIn("pyexcel_localplug", imported)
+
+    def test_no_manifest_without_a_cache_directory(self):
+        del os.environ[plugins.MANIFEST_DIRECTORY_VARIABLE]
+        home = os.path.join(self.directory, "home")
+        os.mkdir(home)
+        with patch.dict(os.environ, {"HOME": home, "XDG_CACHE_HOME": home}):
+            eq_(self.load_plugins()[0], True)
+            eq_(self.load_plugins()[0], True)
+        eq_(os.listdir(home), [])
+
+    def test_pinned_plugins(self):
+        os.environ[plugins.PLUGINS_VARIABLE] = "pyexcel_xlsx, pyexcel_io"
+        eq_(
+            self.load_plugins(),
+            (False, ["pyexcel_xlsx", "pyexcel_io.readers"]),
+        )
+        os.environ[plugins.PLUGINS_VARIABLE] = ""
+        eq_(self.load_plugins(), (False, ["pyexcel_io.readers"]))
+
+    def test_unwritable_manifest(self):
+        os.environ[plugins.MANIFEST_DIRECTORY_VARIABLE] = os.path.join(
+            self.directory, "file"
+        )
+        with open(os.path.join(self.directory, "file"), "w"):
+            pass
+        eq_(self.load_plugins()[0], True)
+        eq_(self.load_plugins()[0], True)
+
+    def tearDown(self):
+        self.path.stop()
+        self.environment.stop()
+        shutil.rmtree(self.directory)
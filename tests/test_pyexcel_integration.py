@@ -50,46 +50,38 @@ class TestAutoDetectInt(TestCase):
 
     def test_auto_detect_int(self):
         sheet = pe.get_sheet(file_name=self.test_file)
-        expected = dedent(
-            """
+        expected = dedent("""
         test_auto_detect_init.csv:
         +---+---+-----+
         | 1 | 2 | 3.1 |
-        +---+---+-----+"""
-        ).strip()
+        +---+---+-----+""").strip()
         self.assertEqual(str(sheet), expected)
 
     def test_get_book_auto_detect_int(self):
         book = pe.get_book(file_name=self.test_file)
-        expected = dedent(
-            """
+        expected = dedent("""
         test_auto_detect_init.csv:
         +---+---+-----+
         | 1 | 2 | 3.1 |
-        +---+---+-----+"""
-        ).strip()
+        +---+---+-----+""").strip()
         self.assertEqual(str(book), expected)
 
     def test_auto_detect_int_false(self):
         sheet = pe.get_sheet(file_name=self.test_file, auto_detect_int=False)
-        expected = dedent(
-            """
+        expected = dedent("""
         test_auto_detect_init.csv:
         +-----+-----+-----+
         | 1.0 | 2.0 | 3.1 |
-        +-----+-----+-----+"""
-        ).strip()
+        +-----+-----+-----+""").strip()
         self.assertEqual(str(sheet), expected)
 
     def test_get_book_auto_detect_int_false(self):
         book = pe.get_book(file_name=self.test_file, auto_detect_int=False)
-        expected = dedent(
-            """
+        expected = dedent("""
         test_auto_detect_init.csv:
         +-----+-----+-----+
         | 1.0 | 2.0 | 3.1 |
-        +-----+-----+-----+"""
-        ).strip()
+        +-----+-----+-----+""").strip()
         self.assertEqual(str(book), expected)
 
     def tearDown(self):
@@ -111,25 +103,21 @@ class TestAutoDetectFloat(TestCase):
     def test_auto_detect_float_false(self):
         sheet = pe.get_sheet(file_name=self.test_file, auto_detect_float=False)
         self.assertEqual(sheet.to_array(), [[1, "2.0", "3.1"]])
-        expected = dedent(
-            """
+        expected = dedent("""
         test_auto_detect_init.csv:
         +---+-----+-----+
         | 1 | 2.0 | 3.1 |
-        +---+-----+-----+"""
-        ).strip()
+        +---+-----+-----+""").strip()
         self.assertEqual(str(sheet), expected)
 
     def test_get_book_auto_detect_float_false(self):
         book = pe.get_book(file_name=self.test_file, auto_detect_float=False)
         self.assertEqual(book[0].to_array(), [[1, "2.0", "3.1"]])
-        expected = dedent(
-            """
+        expected = dedent("""
         test_auto_detect_init.csv:
         +---+-----+-----+
         | 1 | 2.0 | 3.1 |
-        +---+-----+-----+"""
-        ).strip()
+        +---+-----+-----+""").strip()
         self.assertEqual(str(book), expected)
 
     def tearDown(self):
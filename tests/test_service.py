@@ -1,4 +1,5 @@
-from datetime import time, datetime, timedelta
+import math
+from datetime import date, time, datetime, timedelta
 
 from pyexcel_io.service import (
     date_value,
@@ -11,8 +12,13 @@ from pyexcel_io.service import (
     ods_float_value,
     throw_exception,
     detect_int_value,
+    detect_cell_value,
+    detect_date_value,
+    get_csv_converter,
     detect_float_value,
     ods_timedelta_value,
+    make_cell_classifier,
+    _detect_date_value_by_strptime,
 )
 from pyexcel_io.exceptions import IntegerAccuracyLossError
 
@@ -168,3 +174,119 @@ def test_time_value():
 def test_float_value():
     a = float_value("1.2")
     eq_(a, 1.2)
+
+
+CELL_TEXTS = [
+    "0",
+    "00",
+    "014325",
+    "-012",
+    "+5",
+    "12345",
+    " 12",
+    "1_000",
+    "-1_000",
+    "1,000",
+    "0,100",
+    "1,000,000",
+    "1.",
+    ".5",
+    "0.5",
+    "00.5",
+    "0e5",
+    "1e5",
+    "1e999",
+    "-1e999",
+    "inf",
+    "Infinity",
+    "nan",
+    "NaN",
+    "inf ",
+    "information",
+    "name",
+    "hello",
+    "N/A",
+    "\u0661\u0662",
+    "1" * 30,
+    "2015-08-17",
+    "2015-08-17 19:20:00",
+    "2015-08-17 19:20:59.999999",
+    "2015-08-17T19:20",
+    "2015-02-30",
+    "2015-1-1   01:02:03",
+]
+
+
+def test_detect_cell_value():
+    eq_(detect_cell_value("12"), 12)
+    eq_(detect_cell_value("1.5"), 1.5)
+    eq_(detect_cell_value("2015-08-17"), date(2015, 8, 17))
+    eq_(detect_cell_value("014325"), "014325")
+    eq_(detect_cell_value("1e999"), "1e999")
+    eq_(detect_cell_value("1e999", ignore_infinity=False), float("inf"))
+
+
+def test_cell_classifier_agrees_with_detect_cell_value():
+    options = [
+        {},
+        dict(auto_detect_int=False),
+        dict(auto_detect_float=False),
+        dict(auto_detect_int=False, auto_detect_float=False),
+        dict(auto_detect_datetime=False),
+        dict(ignore_infinity=False),
+        dict(pep_0515_off=False),
+        dict(ignore_nan_text=True),
+        dict(default_float_nan="nan"),
+    ]
+    for keywords in options:
+        classify = make_cell_classifier(**keywords)
+        for text in CELL_TEXTS:
+            expected = detect_cell_value(text, **keywords)
+            actual = classify(text)
+            eq_(type(actual), type(expected))
+            if isinstance(expected, float) and math.isnan(expected):
+                assert math.isnan(actual)
+            else:
+                eq_(actual, expected)
+
+
+def test_get_csv_converter():
+    eq_(get_csv_converter(int)("12"), 12)
+    eq_(get_csv_converter(date)("2015-08-17"), date(2015, 8, 17))
+    eq_(get_csv_converter(datetime)("2015-08-17"), datetime(2015, 8, 17))
+    eq_(get_csv_converter(str.upper)("abc"), "ABC")
+
+
+@raises(ValueError)
+def test_csv_date_converter_rejects_datetime():
+    get_csv_converter(date)("2015-08-17 10:00:00")
+
+
+@raises(ValueError)
+def test_csv_converter_needs_a_callable():
+    get_csv_converter("int")
+
+
+DATE_TEXTS = CELL_TEXTS + [
+    "2016-02-29",
+    "2015-00-10",
+    "2015-08-17 24:00:00",
+    "2015-08-17 23:59:60",
+    "2015-08-17 19:20:59.5",
+    "2015-08-17 19:20:59.",
+    "2015-08-17 19:20:59.1234567890",
+    "2015-08-17\t19:20:59",
+    "2015-8-17   9:20:59",
+    "\u0662\u0660\u0661\u0665-08-17",
+    "0000-01-01",
+    "hello world",
+    "abcd-ef-gh",
+]
+
+
+def test_detect_date_value_agrees_with_strptime():
+    for text in DATE_TEXTS:
+        expected = _detect_date_value_by_strptime(text)
+        actual = detect_date_value(text)
+        eq_(type(actual), type(expected))
+        eq_(actual, expected)
@@ -53,3 +53,12 @@ def test_custom_skip_column_func():
     expected = [[2], [5]]
     eq_(expected, actual)
     reader.close()
+
+
+def test_select_columns_from_a_generic_sheet():
+    array = [["a", "b", "c"], [1, 2, 3], [4, 5, 6]]
+    reader = MyReader(array, columns=["c", 0])
+    actual = list(reader.to_array())
+    expected = [["c", "a"], [3, 1], [6, 4]]
+    eq_(expected, actual)
+    reader.close()